@@ -0,0 +1,31 @@
+"""
+Shared setup for the root test scripts.
+
+pytest loads this automatically; the scripts also import it when run directly,
+so src/ is put on sys.path and stdout is set up in exactly one place.
+"""
+
+import sys
+import pathlib
+import functools
+
+SRC_DIR = str(pathlib.Path(__file__).resolve().parent / 'src')
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Flush stdout per line (also when piped), never per write; pytest's capture may not support it
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(line_buffering=True, write_through=False)
+
+# Factory for the persona, which the scripts only read: scripts (or tests) run in one
+# process share one instance. Stateful components are deliberately not cached - RobotState
+# and ConversationGraph carry listeners, quit and battery state, and a VoiceHandler carries
+# its callback and robot state and may have been cleanup()ed by its last user. The costly
+# part of a VoiceHandler, the Whisper model, is already shared by voice_handler._load_model.
+# The import stays lazy so scripts that only need the path setup don't pull in the whole stack.
+
+@functools.lru_cache(maxsize=1)
+def get_persona():
+    from persona import RobotPersona
+    return RobotPersona()
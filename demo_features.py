@@ -71,11 +71,11 @@ def demo_spark_features():
         print("\n📊 Demo 4: System Status")
         print("-" * 40)
         stats = robot_state.get_stats()
-        print(f"🕐 Uptime: {stats['uptime_formatted']}")
-        print(f"🔋 Battery: {stats['battery_level']:.1f}%")
-        print(f"💬 Total Interactions: {stats['total_interactions']}")
-        print(f"✅ Success Rate: {stats['success_rate']:.1f}%")
-        print(f"⚡ Avg Response Time: {stats['avg_response_time']:.3f}s")
+        print(f"🕐 Uptime: {stats.uptime_formatted}")
+        print(f"🔋 Battery: {stats.battery_level:.1f}%")
+        print(f"💬 Total Interactions: {stats.total_interactions}")
+        print(f"✅ Success Rate: {stats.success_rate:.1f}%")
+        print(f"⚡ Avg Response Time: {stats.avg_response_time:.3f}s")
         
         # Demo 5: Show conversation history
         print("\n📚 Demo 5: Recent Conversations")
@@ -123,9 +123,9 @@ def demo_spark_features():
             try:
                 # Show live status
                 stats = robot_state.get_stats()
-                status = "PAUSED" if stats['is_paused'] else "ACTIVE"
+                status = "PAUSED" if stats.is_paused else "ACTIVE"
                 voice_status = "VOICE ON" if voice_handler.is_listening else "VOICE OFF"
-                print(f"\r[Live] {status} | {voice_status} | Battery: {stats['battery_level']:.1f}% | Count: {count}", end="")
+                print(f"\r[Live] {status} | {voice_status} | Battery: {stats.battery_level:.1f}% | Count: {count}", end="")
                 
                 count += 1
                 time.sleep(0.1)
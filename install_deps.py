@@ -38,8 +38,8 @@ def main():
     
     # Check Python version
     python_version = sys.version_info
-    if python_version < (3, 8):
-        print("❌ Python 3.8+ required")
+    if python_version < (3, 12):
+        print("❌ Python 3.12+ required")
         sys.exit(1)
     
     print(f"✅ Python {python_version.major}.{python_version.minor}.{python_version.micro}")
@@ -14,23 +14,36 @@ class Config:
     # ElevenLabs Configuration
     ELEVENLABS_API_KEY = os.getenv('ELEVENLABS_API_KEY', 'mock_elevenlabs_key')
     VOICE_ID = os.getenv('VOICE_ID', 'mock_voice_id')
+    CANNED_PHRASES = [p.strip() for p in os.getenv('CANNED_PHRASES', "Yes|One moment|I didn't catch that").split('|') if p.strip()]
     
     # Audio Configuration
     MICROPHONE_INDEX = int(os.getenv('MICROPHONE_INDEX', '0'))
     SAMPLE_RATE = int(os.getenv('SAMPLE_RATE', '16000'))
-    CHUNK_SIZE = int(os.getenv('CHUNK_SIZE', '1024'))
-    LISTEN_TIMEOUT = float(os.getenv('LISTEN_TIMEOUT', '1.0'))
+    CHUNK_SIZE = int(os.getenv('CHUNK_SIZE', '256'))  # 16ms at 16 kHz
+    LISTEN_TIMEOUT = float(os.getenv('LISTEN_TIMEOUT', '0.5'))
     PHRASE_TIME_LIMIT = float(os.getenv('PHRASE_TIME_LIMIT', '10.0'))
-    PAUSE_THRESHOLD = float(os.getenv('PAUSE_THRESHOLD', '0.5'))
+    PAUSE_THRESHOLD = float(os.getenv('PAUSE_THRESHOLD', '0.4'))
     NON_SPEECH_DURATION = float(os.getenv('NON_SPEECH_DURATION', '0.3'))
     SPEAKER_COOLDOWN = float(os.getenv('SPEAKER_COOLDOWN', '0.8'))
-    DYNAMIC_ENERGY = os.getenv('DYNAMIC_ENERGY', 'true').lower() == 'true'
+    DYNAMIC_ENERGY = os.getenv('DYNAMIC_ENERGY', 'false').lower() == 'true'
+    AUDIO_RT_PRIORITY = os.getenv('AUDIO_RT_PRIORITY', 'false').lower() == 'true'  # Needs CAP_SYS_NICE
+    AUDIO_CPU = int(os.getenv('AUDIO_CPU')) if os.getenv('AUDIO_CPU') else None
+    
+    # Speech Recognition ('whisper' runs locally via faster-whisper, 'google' uses the web API,
+    # 'google_cloud' streams to Cloud Speech-to-Text from VoiceHandlerV2)
+    STT_ENGINE = os.getenv('STT_ENGINE', 'whisper').lower()
+    GOOGLE_STT_API_KEY = os.getenv('GOOGLE_STT_API_KEY', '')  # Empty: speech_recognition's default key
+    WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'tiny.en')
+    ASR_MAX_BUFFER_SECONDS = float(os.getenv('ASR_MAX_BUFFER_SECONDS', '30'))
+    STT_MAX_PENDING = int(os.getenv('STT_MAX_PENDING', '2'))
     
     # Wake Word Configuration
     WAKE_WORD = os.getenv('WAKE_WORD', 'hey_spark').lower()
     
     # Audio Processing
     VAD_SENSITIVITY = float(os.getenv('VAD_SENSITIVITY', '0.5'))
+    VAD_MODE = int(os.getenv('VAD_MODE', '2'))  # webrtcvad aggressiveness, 0-3
+    SILERO_VAD = os.getenv('SILERO_VAD', 'true').lower() == 'true'
     NOISE_REDUCTION = os.getenv('NOISE_REDUCTION', 'true').lower() == 'true'
     
     # Conversation Settings
@@ -144,16 +144,16 @@ class TerminalControl:
         stats = self.robot_state.get_stats()
         
         print("\n=== SYSTEM STATUS ===")
-        print(f"Uptime: {stats['uptime_formatted']}")
-        print(f"Activity: {stats['current_activity']}")
-        print(f"Emotional State: {stats['emotional_state']}")
-        print(f"Current Mood: {stats['current_mood']}")
-        print(f"Battery: {stats['battery_level']:.1f}%")
-        print(f"Paused: {'Yes' if stats['is_paused'] else 'No'}")
-        print(f"Muted: {'Yes' if stats['is_muted'] else 'No'}")
-        print(f"Total Interactions: {stats['total_interactions']}")
-        print(f"Success Rate: {stats['success_rate']:.1f}%")
-        print(f"Avg Response Time: {stats['avg_response_time']:.3f}s")
+        print(f"Uptime: {stats.uptime_formatted}")
+        print(f"Activity: {stats.current_activity}")
+        print(f"Emotional State: {stats.emotional_state}")
+        print(f"Current Mood: {stats.current_mood}")
+        print(f"Battery: {stats.battery_level:.1f}%")
+        print(f"Paused: {'Yes' if stats.is_paused else 'No'}")
+        print(f"Muted: {'Yes' if stats.is_muted else 'No'}")
+        print(f"Total Interactions: {stats.total_interactions}")
+        print(f"Success Rate: {stats.success_rate:.1f}%")
+        print(f"Avg Response Time: {stats.avg_response_time:.3f}s")
         print("===================\n")
     
     def _toggle_mute(self):
@@ -209,7 +209,7 @@ class TerminalControl:
     def _show_battery_status(self):
         """Show detailed battery status."""
         stats = self.robot_state.get_stats()
-        battery = stats['battery_level']
+        battery = stats.battery_level
         
         print("\n=== BATTERY STATUS ===")
         print(f"Current Level: {battery:.1f}%")
@@ -236,7 +236,7 @@ class TerminalControl:
     def _show_errors(self):
         """Show recent system errors."""
         stats = self.robot_state.get_stats()
-        errors = stats['recent_errors']
+        errors = stats.recent_errors
         
         if not errors:
             print("[Control] No recent errors found")
@@ -252,7 +252,7 @@ class TerminalControl:
         if not self.robot_state.is_paused:
             # Show minimal status
             stats = self.robot_state.get_stats()
-            print(f"[Status] {stats['current_activity']} | Battery: {stats['battery_level']:.1f}% | Interactions: {stats['total_interactions']}")
+            print(f"[Status] {stats.current_activity} | Battery: {stats.battery_level:.1f}% | Interactions: {stats.total_interactions}")
     
     def register_callback(self, command: str, callback: Callable):
         """Register a custom callback for a command."""
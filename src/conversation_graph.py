@@ -2,6 +2,7 @@ from typing import Dict, Any, List, Optional
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 import asyncio
+import contextlib
 import time
 from robot_state import RobotState, ActivityStatus, EmotionalState
 from persona import RobotPersona
@@ -21,9 +22,13 @@ class ConversationState(TypedDict):
 class ConversationGraph:
     """LangGraph-based conversation workflow for the robot assistant."""
     
-    def __init__(self, robot_state: RobotState, persona: RobotPersona):
+    def __init__(self, robot_state: RobotState, persona: RobotPersona, http_client=None):
         self.robot_state = robot_state
         self.persona = persona
+        # Optional shared httpx.AsyncClient so every turn reuses pooled keep-alive connections
+        self._http_client = http_client
+        self._openai_client = None
+        self._openai_loop = None  # Loop the client's pooled connections belong to
         # Initialize memory with proper configuration
         self.memory = MemorySaver()
         self.graph = self._build_graph()
@@ -160,13 +165,14 @@ class ConversationGraph:
             if state.get("robot_response"):
                 print(f"🤖 {state['robot_response']}")
                 try:
-                    # Get the voice handler from robot state and speak the response
+                    # Get the voice handler from robot state and speak the response.
+                    # Playback blocks for seconds, so it runs in a worker thread and the event loop
+                    # (timeouts, signal handlers, other tasks) keeps running meanwhile.
                     if hasattr(self.robot_state, 'voice_handler') and self.robot_state.voice_handler:
-                        self.robot_state.voice_handler.speak_text(state["robot_response"])
+                        await asyncio.to_thread(self.robot_state.voice_handler.speak_text, state["robot_response"])
                     else:
                         # Fallback: just wait a bit to simulate speech
-                        import time
-                        time.sleep(len(state["robot_response"]) * 0.05)
+                        await asyncio.sleep(len(state["robot_response"]) * 0.05)
                 except Exception as e:
                     print(f"[{self.persona.name}] Error in voice output: {e}")
                     # Fallback: just wait a bit to simulate speech
@@ -295,16 +301,12 @@ class ConversationGraph:
     async def _generate_real_response(self, user_input: str, context: str = "") -> tuple[str, float]:
         """Generate a response using OpenAI API."""
         try:
-            import openai
             from config import Config
             
             # Check if OpenAI API key is configured
             if not Config.OPENAI_API_KEY or Config.OPENAI_API_KEY == "your_openai_api_key_here":
                 return "I'd love to give you a smart response, but my AI brain isn't connected yet. Please check your OpenAI API key configuration.", 0.1
             
-            # Configure OpenAI client
-            client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
-            
             # Build the prompt with persona and recent conversation
             system_prompt = self.persona.get_personality_prompt()
             history_snippet = ""
@@ -330,34 +332,35 @@ class ConversationGraph:
             
             use_web = getattr(Config, "ENABLE_WEB_SEARCH", False)
             
-            if use_web:
-                response = client.responses.create(
-                    model=Config.OPENAI_MODEL,
-                    input=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    tools=[{"type": "web_search", "name": "web"}],
-                    tool_choice="auto",
-                    temperature=0.8,
-                    max_output_tokens=200,
-                )
-                ai_response = self._extract_response_text(response)
-                token_usage = getattr(response, "usage", None)
-                total_tokens = getattr(token_usage, "total_tokens", 0) if token_usage else 0
-                processing_time = total_tokens / 1000 if total_tokens else 0.3
-            else:
-                response = client.chat.completions.create(
-                    model=Config.OPENAI_MODEL,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    max_tokens=120,
-                    temperature=0.8
-                )
-                ai_response = response.choices[0].message.content.strip()
-                processing_time = response.usage.total_tokens / 1000  # Rough time estimate
+            async with self._openai_session() as client:
+                if use_web:
+                    response = await client.responses.create(
+                        model=Config.OPENAI_MODEL,
+                        input=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        tools=[{"type": "web_search", "name": "web"}],
+                        tool_choice="auto",
+                        temperature=0.8,
+                        max_output_tokens=200,
+                    )
+                    ai_response = self._extract_response_text(response)
+                    token_usage = getattr(response, "usage", None)
+                    total_tokens = getattr(token_usage, "total_tokens", 0) if token_usage else 0
+                    processing_time = total_tokens / 1000 if total_tokens else 0.3
+                else:
+                    response = await client.chat.completions.create(
+                        model=Config.OPENAI_MODEL,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt}
+                        ],
+                        max_tokens=120,
+                        temperature=0.8
+                    )
+                    ai_response = response.choices[0].message.content.strip()
+                    processing_time = response.usage.total_tokens / 1000  # Rough time estimate
             
             return ai_response, processing_time
             
@@ -365,6 +368,23 @@ class ConversationGraph:
             print(f"OpenAI API error: {e}")
             return f"I encountered an error with my AI brain: {str(e)[:50]}... Falling back to basic responses.", 0.1
     
+    @contextlib.asynccontextmanager
+    async def _openai_session(self):
+        """Yield an async OpenAI client, reusing the shared httpx pool when one was passed in."""
+        if self._http_client is None:
+            # No shared pool: a client per call, closed with its sockets, so nothing outlives the turn's loop
+            import openai
+            async with openai.AsyncOpenAI(api_key=Config.OPENAI_API_KEY) as client:
+                yield client
+            return
+        # Shared pool, owned and closed by the caller; rebuilt per event loop since connections can't cross loops
+        loop = asyncio.get_running_loop()
+        if self._openai_client is None or self._openai_loop is not loop:
+            import openai
+            self._openai_client = openai.AsyncOpenAI(api_key=Config.OPENAI_API_KEY, http_client=self._http_client)
+            self._openai_loop = loop
+        yield self._openai_client
+    
     def _extract_response_text(self, response) -> str:
         """Normalize text output from the Responses API."""
         try:
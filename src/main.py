@@ -5,9 +5,11 @@ A witty robot persona assistant with voice interaction capabilities.
 """
 
 import asyncio
+import logging
 import signal
 import sys
 import os
+from dataclasses import asdict
 from typing import Optional
 
 # Add the src directory to the path
@@ -146,14 +148,6 @@ class RobotAssistant:
                         time.sleep(0.1)
                         continue
                     
-                    # Process any pending voice input
-                    if hasattr(self.voice_handler, 'audio_queue') and not self.voice_handler.audio_queue.empty():
-                        try:
-                            audio_data = self.voice_handler.audio_queue.get_nowait()
-                            # Process audio data if needed
-                        except:
-                            pass
-                    
                     # Check if global quit command was received
                     if self.robot_state.should_quit:
                         print("\n[Global Control] Quit command received, shutting down...")
@@ -295,7 +289,7 @@ class RobotAssistant:
         if not self.robot_state:
             return {"status": "not_initialized"}
         
-        status = self.robot_state.get_stats()
+        status = asdict(self.robot_state.get_stats())
         status.update({
             "is_running": self.is_running,
             "persona_name": self.persona.name if self.persona else None,
@@ -307,6 +301,8 @@ class RobotAssistant:
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=Config.LOG_LEVEL.upper(), format="[%(name)s] %(levelname)s: %(message)s")
+    
     try:
         # Create and run robot assistant
         robot = RobotAssistant()
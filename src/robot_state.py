@@ -1,6 +1,7 @@
 import json
 import time
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -42,6 +43,25 @@ class RobotMood:
     last_mood_change: str
     mood_duration: float  # seconds
 
+@dataclass(slots=True, frozen=True)
+class StatsSnapshot:
+    """Point-in-time statistics returned by RobotState.get_stats()."""
+    uptime_seconds: float
+    uptime_formatted: str
+    total_interactions: int
+    successful_interactions: int
+    failed_interactions: int
+    success_rate: float
+    avg_response_time: float
+    battery_level: float
+    current_activity: str
+    emotional_state: str
+    current_mood: str
+    is_paused: bool
+    is_muted: bool
+    conversation_history_size: int
+    recent_errors: List[str]
+
 class RobotState:
     """Persistent state management for the robot assistant."""
     
@@ -70,6 +90,12 @@ class RobotState:
         # Voice handler reference
         self.voice_handler = None
         
+        # Listeners notified when displayed state (pause, mute, battery, quit) changes
+        self._state_listeners: List[Callable[[], None]] = []
+        # Bumped on every such change; threads can block on the condition instead of polling
+        self._state_cv = threading.Condition()
+        self._state_version = 0
+        
         # Global control file monitoring
         self.control_file = "data/spark_control.txt"
         self.last_control_check = 0
@@ -143,6 +169,7 @@ class RobotState:
         
         # Update battery (simulated drain)
         self.battery_level = max(0.0, self.battery_level - 0.1)
+        self._notify_state_change()
         
         self._log_state_change(f"Added conversation entry. Total: {self.total_interactions}")
     
@@ -187,6 +214,28 @@ class RobotState:
         self.voice_handler = voice_handler
         self._log_state_change("Voice handler registered")
     
+    def add_state_listener(self, listener: Callable[[], None]):
+        """Register a callable invoked (from any thread) when pause, mute, battery or quit state changes."""
+        self._state_listeners.append(listener)
+    
+    @property
+    def state_version(self) -> int:
+        """Counter bumped each time pause, mute, battery or quit state changes."""
+        return self._state_version
+    
+    def wait_for_state_change(self, version: int, timeout: Optional[float] = None) -> int:
+        """Block until the state moves past `version` (or the timeout passes); return the current version."""
+        with self._state_cv:
+            self._state_cv.wait_for(lambda: self._state_version != version, timeout)
+            return self._state_version
+    
+    def _notify_state_change(self):
+        with self._state_cv:
+            self._state_version += 1
+            self._state_cv.notify_all()
+        for listener in self._state_listeners:
+            listener()
+    
     def check_global_controls(self):
         """Check for global control commands from external terminals."""
         import os
@@ -248,6 +297,7 @@ class RobotState:
             self._log_state_change("Quit command received from global control")
             # Set a flag that the main application can check
             self.should_quit = True
+            self._notify_state_change()
     
     def toggle_pause(self):
         """Toggle the paused state."""
@@ -264,12 +314,14 @@ class RobotState:
                 self.voice_handler.resume_listening()
         
         self._log_state_change(f"Pause toggled: {self.is_paused}")
+        self._notify_state_change()
         return self.is_paused
     
     def toggle_mute(self):
         """Toggle the muted state."""
         self.is_muted = not self.is_muted
         self._log_state_change(f"Mute toggled: {self.is_muted}")
+        self._notify_state_change()
         return self.is_muted
     
     def reset_conversation(self):
@@ -284,27 +336,27 @@ class RobotState:
         
         self._log_state_change("Conversation reset")
     
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self) -> StatsSnapshot:
         """Get current statistics and state."""
         uptime = time.time() - self.start_time
         
-        return {
-            "uptime_seconds": uptime,
-            "uptime_formatted": self._format_uptime(uptime),
-            "total_interactions": self.total_interactions,
-            "successful_interactions": self.successful_interactions,
-            "failed_interactions": self.failed_interactions,
-            "success_rate": (self.successful_interactions / max(1, self.total_interactions)) * 100,
-            "avg_response_time": self.avg_response_time,
-            "battery_level": self.battery_level,
-            "current_activity": self.current_activity.value,
-            "emotional_state": self.emotional_state.value,
-            "current_mood": self.mood.current_mood,
-            "is_paused": self.is_paused,
-            "is_muted": self.is_muted,
-            "conversation_history_size": len(self.conversation_history),
-            "recent_errors": self.system_errors[-5:] if self.system_errors else []
-        }
+        return StatsSnapshot(
+            uptime_seconds=uptime,
+            uptime_formatted=self._format_uptime(uptime),
+            total_interactions=self.total_interactions,
+            successful_interactions=self.successful_interactions,
+            failed_interactions=self.failed_interactions,
+            success_rate=(self.successful_interactions / max(1, self.total_interactions)) * 100,
+            avg_response_time=self.avg_response_time,
+            battery_level=self.battery_level,
+            current_activity=self.current_activity.value,
+            emotional_state=self.emotional_state.value,
+            current_mood=self.mood.current_mood,
+            is_paused=self.is_paused,
+            is_muted=self.is_muted,
+            conversation_history_size=len(self.conversation_history),
+            recent_errors=self.system_errors[-5:] if self.system_errors else []
+        )
     
     def get_recent_conversations(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get recent conversation entries."""
@@ -1,68 +1,142 @@
-import speech_recognition as sr
-import pygame
-import pyaudio
-import wave
+import functools
+import logging
+import math
 import threading
 import time
 import queue
+from collections import OrderedDict, deque
 from typing import Optional, Callable, List, Dict
 from config import Config
 
+log = logging.getLogger(__name__)
+
+# Audio stack is imported on first use (see _import_audio_modules) so callers
+# that never touch voice I/O don't pay for loading it.
+sr = None
+pygame = None
+pyaudio = None
+
+def _import_audio_modules():
+    """Import speech_recognition, pygame and pyaudio into module globals."""
+    global sr, pygame, pyaudio
+    if sr is None:
+        import speech_recognition as sr
+    if pygame is None:
+        import pygame
+    if pyaudio is None:
+        import pyaudio
+
+@functools.lru_cache(maxsize=1)
+def _load_model(name: str, num_workers: int):
+    """Build the faster-whisper model once per process; later VoiceHandlers share it."""
+    from faster_whisper import WhisperModel
+    import ctranslate2
+    
+    use_cuda = ctranslate2.get_cuda_device_count() > 0
+    model = WhisperModel(
+        name,
+        device="cuda" if use_cuda else "cpu",
+        compute_type="int8_float16" if use_cuda else "int8",
+        num_workers=num_workers,
+    )
+    return model, "cuda" if use_cuda else "cpu"
+
+@functools.lru_cache(maxsize=8)
+def _mock_tone_sound(duration: float, frequency: int):
+    """Mock-speech tone rendered once per duration, in the mixer's own rate/channel layout."""
+    import numpy as np
+    sample_rate, _, channels = pygame.mixer.get_init()
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    tone = (np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
+    if channels > 1:
+        tone = np.repeat(tone[:, np.newaxis], channels, axis=1)
+    return pygame.sndarray.make_sound(tone)
+
 class VoiceHandler:
     """Handles voice input/output for the robot assistant."""
     
     def __init__(self):
-        self.recognizer = sr.Recognizer()
+        self.recognizer = None
         self.microphone = None
-        self.audio_queue = queue.Queue()
+        self.audio_queue = queue.Queue(maxsize=Config.STT_MAX_PENDING)
         self.is_listening = False
         self.is_speaking = False
         self.audio_thread = None
         self.callback = None
         self.robot_state = None  # Reference to robot state for pause checking
-        self._playback_active = False
-        self._playback_end_time = 0.0
+        self._mute_until = 0.0  # time.monotonic() deadline; math.inf while speaking
+        
+        # Wake word matching (lower-cased once instead of on every utterance)
+        self._wake_word_lc = Config.WAKE_WORD.lower()
+        self._fillers = ("please", "can you", "would you", "could you")
         
         # Audio settings
         self.sample_rate = Config.SAMPLE_RATE
         self.chunk_size = Config.CHUNK_SIZE
         self.channels = 1
-        self.format = pyaudio.paInt16
+        self.format = None  # pyaudio.paInt16 once the audio stack is loaded
+        self._input_devices: Optional[Dict[int, Dict]] = None
         
         # Performance optimization attributes
         self._elevenlabs_client = None
         self._voice_id = None
+        self._http = None  # Shared keep-alive HTTP client for ElevenLabs
+        self._http_lock = threading.Lock()  # Pre-warm thread and speech fallback may both create it
+        self._tts_cache = OrderedDict()  # (voice_id, text) -> synthesized MP3 bytes
+        self._tts_cache_size = 32
+        self._tts_cache_lock = threading.Lock()
+        self._prewarm_done = threading.Event()
+        
+        # Long-lived speech-to-text workers fed from audio_queue
+        self._stt_workers = 2
+        self._processor_threads: List[threading.Thread] = []
+        
+        # Local speech recognition model (None -> Google Web Speech API)
+        self._asr = None
+        
+        # WebRTC voice activity detector for phrase endpointing (None -> recognizer.listen)
+        self._vad = None
+        self._vad_frame_ms = 20
+        self._vad_end_frames = 10  # 200ms of trailing silence ends a phrase
+        self._vad_preroll_frames = 10  # Keep 200ms before speech onset
+        
+        # Warm up ElevenLabs in the background while audio initializes
+        threading.Thread(target=self._pre_warm_elevenlabs, daemon=True).start()
         
         # Initialize audio components
         self._init_audio()
+        self._init_asr()
+        self._init_vad()
     
     def _init_audio(self):
         """Initialize audio components."""
         try:
+            _import_audio_modules()
+            
+            self.recognizer = sr.Recognizer()
+            self.recognizer.pause_threshold = Config.PAUSE_THRESHOLD
+            self.recognizer.non_speaking_duration = Config.NON_SPEECH_DURATION
+            self.format = pyaudio.paInt16
+            
             # Initialize PyAudio
             self.audio = pyaudio.PyAudio()
             
-            # Try to find available audio devices
+            # Find available input devices (enumerated once and cached)
             input_devices = []
             pulse_device = None
             default_device = None
             
-            for i in range(self.audio.get_device_count()):
-                try:
-                    info = self.audio.get_device_info_by_index(i)
-                    if info['maxInputChannels'] > 0:
-                        device_name = info['name'].lower()
-                        device_entry = (i, info['name'])
-                        input_devices.append(device_entry)
-                        print(f"[Voice] Found input device {i}: {info['name']}")
-                        
-                        # Track PulseAudio and default devices for fallback
-                        if 'pulse' in device_name and pulse_device is None:
-                            pulse_device = device_entry
-                        if 'default' in device_name and default_device is None:
-                            default_device = device_entry
-                except:
-                    pass
+            for i, info in self._enumerate_input_devices().items():
+                device_name = info['name'].lower()
+                device_entry = (i, info['name'])
+                input_devices.append(device_entry)
+                log.debug("Found input device %s: %s", i, info['name'])
+                
+                # Track PulseAudio and default devices for fallback
+                if 'pulse' in device_name and pulse_device is None:
+                    pulse_device = device_entry
+                if 'default' in device_name and default_device is None:
+                    default_device = device_entry
             
             # Device selection priority:
             # 1. Config.MICROPHONE_INDEX if explicitly set and valid
@@ -79,23 +153,13 @@ class VoiceHandler:
                 print(f"[Voice] 📋 Available input devices: {[(idx, name) for idx, name in input_devices]}")
                 
                 # Verify the specified device index exists and has input channels
-                found_config_device = False
-                for dev_idx, dev_name in input_devices:
-                    if dev_idx == Config.MICROPHONE_INDEX:
-                        # Double-check the device is actually accessible
-                        try:
-                            test_info = self.audio.get_device_info_by_index(Config.MICROPHONE_INDEX)
-                            if test_info['maxInputChannels'] > 0:
-                                device_index = Config.MICROPHONE_INDEX
-                                device_name = dev_name
-                                found_config_device = True
-                                print(f"[Voice] ✅ Found and validated configured microphone index: {Config.MICROPHONE_INDEX} ({device_name})")
-                                print(f"[Voice]    Device details: {test_info['maxInputChannels']} input channels, {int(test_info['defaultSampleRate'])} Hz")
-                                break
-                            else:
-                                print(f"[Voice] ⚠️  Device {Config.MICROPHONE_INDEX} exists but has no input channels")
-                        except Exception as e:
-                            print(f"[Voice] ⚠️  Error validating device {Config.MICROPHONE_INDEX}: {e}")
+                test_info = self._input_devices.get(Config.MICROPHONE_INDEX)
+                found_config_device = test_info is not None
+                if found_config_device:
+                    device_index = Config.MICROPHONE_INDEX
+                    device_name = test_info['name']
+                    print(f"[Voice] ✅ Found and validated configured microphone index: {Config.MICROPHONE_INDEX} ({device_name})")
+                    print(f"[Voice]    Device details: {test_info['maxInputChannels']} input channels, {int(test_info['defaultSampleRate'])} Hz")
                 
                 # If configured index not found, warn user
                 if not found_config_device:
@@ -125,19 +189,19 @@ class VoiceHandler:
                 else:
                     # Fallback to default microphone
                     print("[Voice] No input devices found, using default microphone")
-                    self.microphone = sr.Microphone()
+                    self.microphone = self._create_microphone()
                     return
             
             # Create microphone with selected device (with error handling)
             try:
                 print(f"[Voice] Attempting to create microphone with device index: {device_index}")
-                self.microphone = sr.Microphone(device_index=device_index)
+                self.microphone = self._create_microphone(device_index)
                 print(f"[Voice] ✅ Selected input device: {device_name} (index {device_index})")
             except Exception as e:
                 print(f"[Voice] ❌ Error creating microphone with device index {device_index}: {e}")
                 print(f"[Voice] Falling back to default microphone...")
                 try:
-                    self.microphone = sr.Microphone()
+                    self.microphone = self._create_microphone()
                     print(f"[Voice] ✅ Using default microphone as fallback")
                 except Exception as e2:
                     print(f"[Voice] ❌ Error creating default microphone: {e2}")
@@ -148,7 +212,9 @@ class VoiceHandler:
             if self.microphone:
                 try:
                     with self.microphone as source:
-                        self.recognizer.adjust_for_ambient_noise(source, duration=1)
+                        self.recognizer.adjust_for_ambient_noise(source, duration=0.3)
+                    # Keep the calibrated threshold instead of recomputing it every chunk
+                    self.recognizer.dynamic_energy_threshold = Config.DYNAMIC_ENERGY
                     print("[Voice] Ambient noise adjustment completed")
                 except Exception as e:
                     print(f"[Voice] Warning: Could not adjust for ambient noise: {e}")
@@ -169,6 +235,67 @@ class VoiceHandler:
             traceback.print_exc()
             print("[Voice] Running in text-only mode")
     
+    def _create_microphone(self, device_index: Optional[int] = None):
+        """Create a microphone source with small chunks at the recognizer sample rate."""
+        return sr.Microphone(device_index=device_index, sample_rate=self.sample_rate, chunk_size=self.chunk_size)
+    
+    def _is_muted(self) -> bool:
+        """Whether capture should be skipped because of our own playback or its cooldown."""
+        return time.monotonic() < self._mute_until
+    
+    def _init_asr(self):
+        """Load the local faster-whisper model if configured and installed."""
+        if Config.STT_ENGINE != "whisper":
+            print(f"[Voice] Using '{Config.STT_ENGINE}' speech recognition")
+            return
+        
+        try:
+            # One worker per STT thread
+            self._asr, device = _load_model(Config.WHISPER_MODEL, self._stt_workers)
+            print(f"[Voice] Local speech recognition ready ({Config.WHISPER_MODEL} on {device})")
+        except ImportError:
+            print("[Voice] faster-whisper not installed, falling back to Google speech recognition")
+        except Exception as e:
+            print(f"[Voice] Warning: Could not load Whisper model, falling back to Google: {e}")
+            self._asr = None
+    
+    def _init_vad(self):
+        """Create the webrtcvad detector if the package and sample rate allow it."""
+        if not self.microphone:
+            return
+        if self.sample_rate not in (8000, 16000, 32000, 48000):
+            print(f"[Voice] VAD endpointing unavailable at {self.sample_rate} Hz, using phrase time limit")
+            return
+        
+        try:
+            import webrtcvad
+            self._vad = webrtcvad.Vad(Config.VAD_MODE)
+            print(f"[Voice] VAD endpointing enabled (mode {Config.VAD_MODE})")
+        except ImportError:
+            print("[Voice] webrtcvad not installed, using phrase time limit")
+        except Exception as e:
+            print(f"[Voice] Warning: Could not initialize VAD: {e}")
+    
+    def _transcribe(self, audio) -> str:
+        """Convert captured audio to text using the local model or Google."""
+        if self._asr is None:
+            return self.recognizer.recognize_google(audio)
+        
+        import numpy as np
+        
+        # Whisper expects 16 kHz mono float32
+        pcm = np.frombuffer(audio.get_raw_data(convert_rate=16000, convert_width=2), dtype=np.int16)
+        segments, _ = self._asr.transcribe(
+            pcm.astype(np.float32) / 32768.0,
+            language="en",
+            beam_size=1,
+            vad_filter=True,
+        )
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+    
     def set_callback(self, callback: Callable[[str], None]):
         """Set callback function for when speech is recognized."""
         self.callback = callback
@@ -182,10 +309,8 @@ class VoiceHandler:
         if self.is_listening:
             return
         
-        # Pre-warm ElevenLabs for faster responses
-        self._pre_warm_elevenlabs()
-        
         self.is_listening = True
+        self._start_processors()
         self.audio_thread = threading.Thread(target=self._listen_loop, daemon=True)
         self.audio_thread.start()
         print("[Voice] Started listening for voice input...")
@@ -220,7 +345,7 @@ class VoiceHandler:
                     continue
                 
                 # Skip capture while our own playback is active
-                if self._playback_active or time.time() < self._playback_end_time:
+                if self._is_muted():
                     time.sleep(0.05)
                     continue
                 
@@ -228,13 +353,20 @@ class VoiceHandler:
                     # Use non-blocking audio capture
                     try:
                         with self.microphone as source:
-                            # Very short timeout to prevent blocking
-                            audio = self.recognizer.listen(source, timeout=0.05, phrase_time_limit=2)
-                            if self._playback_active or time.time() < self._playback_end_time:
+                            if self._vad is not None:
+                                # End the phrase on trailing silence instead of a fixed cutoff
+                                audio = self._listen_vad(source)
+                            else:
+                                audio = self.recognizer.listen(
+                                    source,
+                                    timeout=Config.LISTEN_TIMEOUT,
+                                    phrase_time_limit=Config.PHRASE_TIME_LIMIT,
+                                )
+                            if self._is_muted():
                                 continue
                             if audio:
-                                # Process the audio in a separate thread to avoid blocking
-                                threading.Thread(target=self._process_audio, args=(audio,), daemon=True).start()
+                                # Hand the audio to the STT workers to avoid blocking
+                                self._submit_audio(audio)
                     except sr.WaitTimeoutError:
                         # No speech detected, continue immediately
                         pass
@@ -253,27 +385,118 @@ class VoiceHandler:
                 print(f"[Voice] Error in listening loop: {e}")
                 time.sleep(0.05)  # Very short error delay
     
+    def _listen_vad(self, source):
+        """Capture one phrase from the open microphone using webrtcvad endpointing.
+        
+        Returns None if no speech starts within LISTEN_TIMEOUT or playback begins.
+        """
+        frame_samples = int(source.SAMPLE_RATE * self._vad_frame_ms / 1000)
+        max_frames = int(Config.PHRASE_TIME_LIMIT * 1000 / self._vad_frame_ms)
+        wait_frames = int(Config.LISTEN_TIMEOUT * 1000 / self._vad_frame_ms)
+        
+        is_speech = self._vad.is_speech
+        
+        # Wait for speech onset, keeping a short pre-roll so the first syllable isn't clipped
+        preroll = deque(maxlen=self._vad_preroll_frames)
+        for _ in range(wait_frames):
+            if not self.is_listening or self._is_muted():
+                return None
+            frame = source.stream.read(frame_samples)
+            preroll.append(frame)
+            if is_speech(frame, source.SAMPLE_RATE):
+                break
+        else:
+            return None
+        
+        # Record until enough trailing silence or the phrase time limit
+        frames = list(preroll)
+        silent_frames = 0
+        while len(frames) < max_frames:
+            if not self.is_listening or self._is_muted():
+                return None
+            frame = source.stream.read(frame_samples)
+            frames.append(frame)
+            silent_frames = 0 if is_speech(frame, source.SAMPLE_RATE) else silent_frames + 1
+            if silent_frames >= self._vad_end_frames:
+                break
+        
+        return sr.AudioData(b"".join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+    
+    def _submit_audio(self, audio):
+        """Queue captured audio for recognition, dropping the oldest backlog entry if full."""
+        # Cap the utterance length so a slow recognizer never sees an unbounded buffer
+        max_bytes = int(Config.ASR_MAX_BUFFER_SECONDS * audio.sample_rate) * audio.sample_width
+        if len(audio.frame_data) > max_bytes:
+            print(f"[Voice] Utterance exceeds {Config.ASR_MAX_BUFFER_SECONDS:.0f}s, dropping oldest audio")
+            audio = sr.AudioData(audio.frame_data[-max_bytes:], audio.sample_rate, audio.sample_width)
+        
+        try:
+            self.audio_queue.put_nowait(audio)
+        except queue.Full:
+            # Drop the oldest waiting utterance to keep latency bounded
+            try:
+                self.audio_queue.get_nowait()
+                print("[Voice] STT backlog full, dropped oldest pending audio")
+            except queue.Empty:
+                pass
+            try:
+                self.audio_queue.put_nowait(audio)
+            except queue.Full:
+                print("[Voice] STT backlog full, dropped new audio")
+    
+    def _start_processors(self):
+        """Start the speech-to-text worker threads if they are not running."""
+        self._processor_threads = [t for t in self._processor_threads if t.is_alive()]
+        for i in range(len(self._processor_threads), self._stt_workers):
+            thread = threading.Thread(target=self._processor_loop, name=f"stt-{i}", daemon=True)
+            thread.start()
+            self._processor_threads.append(thread)
+    
+    def _stop_processors(self):
+        """Signal the speech-to-text worker threads to exit."""
+        while True:
+            try:
+                self.audio_queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in self._processor_threads:
+            try:
+                self.audio_queue.put(None, timeout=1)
+            except queue.Full:
+                pass
+        for thread in self._processor_threads:
+            thread.join(timeout=1)
+        self._processor_threads = []
+    
+    def _processor_loop(self):
+        """Recognize queued utterances until a None sentinel is received."""
+        while True:
+            audio = self.audio_queue.get()
+            if audio is None:
+                break
+            self._process_audio(audio)
+    
     def _process_audio(self, audio):
         """Process captured audio and convert to text."""
         try:
-            if self._playback_active or time.time() < self._playback_end_time:
+            if self._is_muted():
                 return
-            print("[Voice] Processing audio... *whirr*")
+            log.debug("Processing audio...")
             
             # Convert speech to text
-            text = self.recognizer.recognize_google(audio)
+            text = self._transcribe(audio)
             
             if text:
                 print(f"[Voice] Recognized: '{text}'")
                 
                 # For now, respond to all voice input (no wake word required)
-                print("[Voice] Voice input received!")
+                log.debug("Voice input received!")
                 
                 if self.callback:
-                    print(f"[Voice] Sending '{text}' to conversation handler...")
+                    log.debug("Sending '%s' to conversation handler...", text)
                     self.callback(text)
                 else:
-                    print("[Voice] No callback registered")
+                    log.warning("No callback registered")
             
         except sr.UnknownValueError:
             print("[Voice] Could not understand audio")
@@ -287,27 +510,25 @@ class VoiceHandler:
         if not text:
             return False
         
-        wake_word = Config.WAKE_WORD.lower()
-        return wake_word in text.lower()
+        return self._wake_word_lc in text.lower()
     
     def _extract_command(self, text: str) -> str:
         """Extract the command part after the wake word."""
-        wake_word = Config.WAKE_WORD.lower()
+        wake_word = self._wake_word_lc
         text_lower = text.lower()
         
-        if wake_word in text_lower:
-            # Find the position after the wake word
-            wake_pos = text_lower.find(wake_word)
+        wake_pos = text_lower.find(wake_word)
+        if wake_pos != -1:
+            # Extract the command after the wake word and clean it up
             command_start = wake_pos + len(wake_word)
-            
-            # Extract the command and clean it up
             command = text[command_start:].strip()
+            command_lower = command.lower()
             
             # Remove common filler words
-            filler_words = ["please", "can you", "would you", "could you"]
-            for filler in filler_words:
-                if command.lower().startswith(filler):
-                    command = command[len(filler):].strip()
+            while command_lower.startswith(self._fillers):
+                filler = next(f for f in self._fillers if command_lower.startswith(f))
+                command = command[len(filler):].strip()
+                command_lower = command.lower()
             
             return command if command else "Hello"
         
@@ -319,7 +540,7 @@ class VoiceHandler:
             return
         
         self.is_speaking = True
-        self._playback_active = True
+        self._mute_until = math.inf
         
         try:
             print(f"[Voice] Speaking: {text}")
@@ -330,15 +551,14 @@ class VoiceHandler:
         except Exception as e:
             print(f"[Voice] Error in speech synthesis: {e}")
         finally:
-            self._playback_active = False
             cooldown = max(0.8, len(text) * 0.05)
-            self._playback_end_time = time.time() + cooldown
+            self._mute_until = time.monotonic() + cooldown
             self.is_speaking = False
     
     def _simulate_speech(self, text: str):
         """Simulate speech output using pygame or ElevenLabs API."""
         try:
-            print(f"[Voice] Processing speech: '{text}'")
+            log.debug("Processing speech: '%s'", text)
             
             # Add safety timeout for entire speech process
             import time
@@ -365,154 +585,110 @@ class VoiceHandler:
         """Check if we should use real ElevenLabs API or mock speech."""
         from config import Config
         result = (Config.ELEVENLABS_API_KEY and 
-                Config.ELEVENLABS_API_KEY != "your_elevenlabs_api_key_here" and
+                Config.ELEVENLABS_API_KEY not in ("your_elevenlabs_api_key_here", "mock_elevenlabs_key") and
                 not Config.DEV_MODE)  # DEV_MODE is already a boolean
-        print(f"[Voice] _should_use_real_tts: {result}")
-        print(f"[Voice]   - ELEVENLABS_API_KEY: {bool(Config.ELEVENLABS_API_KEY)}")
-        print(f"[Voice]   - Not default: {Config.ELEVENLABS_API_KEY != 'your_elevenlabs_api_key_here'}")
-        print(f"[Voice]   - DEV_MODE: {Config.DEV_MODE}")
+        log.debug("_should_use_real_tts: %s", result)
+        log.debug("  - ELEVENLABS_API_KEY: %s", bool(Config.ELEVENLABS_API_KEY))
+        log.debug("  - Not default: %s", Config.ELEVENLABS_API_KEY != 'your_elevenlabs_api_key_here')
+        log.debug("  - DEV_MODE: %s", Config.DEV_MODE)
         return result
     
     def _generate_real_speech(self, text: str):
         """Generate speech using ElevenLabs API with optimized performance."""
         try:
-            from elevenlabs import ElevenLabs
             from config import Config
             
-            print(f"[Voice] Using ElevenLabs API for speech... *whirr*")
-            print(f"[Voice] Text to convert: '{text}'")
-            
-            # Use pre-warmed client for faster response
-            client = self._get_elevenlabs_client()
-            voice_id = self._voice_id or Config.VOICE_ID or "21m00Tcm4TlvDq8ikWAM"
-            print(f"[Voice] Using pre-warmed ElevenLabs client with voice ID: {voice_id}")
-            
-            print(f"[Voice] Calling ElevenLabs API with optimized settings...")
-            audio_stream = client.text_to_speech.convert(
-                voice_id=voice_id,
-                text=text,
-                output_format="mp3_44100_64",  # Lower bitrate for faster processing
-                model_id="eleven_multilingual_v2",
-                voice_settings={
-                    "stability": 0.5,  # Lower stability for faster generation
-                    "similarity_boost": 0.5  # Lower similarity for speed
-                }
-            )
-            print(f"[Voice] ElevenLabs API call successful, audio stream received")
-            
-            # Optimized audio processing for speed
-            import tempfile
-            import os
-            
-            print(f"[Voice] Processing audio stream for fast playback...")
-            # Convert generator to bytes more efficiently
-            audio_bytes = b''.join(audio_stream)
-            print(f"[Voice] Audio stream converted to bytes: {len(audio_bytes)} bytes")
-            
-            # Create temporary file with optimized settings
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                temp_file.write(audio_bytes)
-                temp_file.flush()
-                print(f"[Voice] Audio saved to temporary file: {temp_file.name}")
-                
-                # Fast audio loading and playback
-                print(f"[Voice] Loading audio into pygame...")
-                pygame.mixer.music.load(temp_file.name)
-                print(f"[Voice] Starting audio playback immediately...")
-                pygame.mixer.music.play()
-                
-                # Reduced timeout for faster response
-                import time
-                start_time = time.time()
-                timeout = 8.0  # Reduced timeout for faster processing
-                
-                print(f"[Voice] Monitoring audio playback...")
-                while pygame.mixer.music.get_busy() and (time.time() - start_time) < timeout:
-                    time.sleep(0.05)  # Faster polling for responsiveness
-                
-                # Force stop if still playing
-                if pygame.mixer.music.get_busy():
-                    pygame.mixer.music.stop()
-                    print("[Voice] Audio playback stopped (timeout)")
-                
-                print(f"[Voice] Audio playback completed successfully!")
-                
-                # Immediate cleanup for better performance
-                try:
-                    os.unlink(temp_file.name)
-                    print(f"[Voice] Temporary file cleaned up")
-                except Exception as e:
-                    print(f"[Voice] Error cleaning up temp file: {e}")
+            log.debug("Using ElevenLabs API for speech...")
+            log.debug("Text to convert: '%s'", text)
+            
+            audio_bytes = self._synthesize_elevenlabs(text)
+            log.debug("Audio ready for playback: %s bytes", len(audio_bytes))
+            
+            # Decode the short clip in memory instead of streaming it from a temp file
+            import io
+            sound = pygame.mixer.Sound(file=io.BytesIO(audio_bytes))
+            log.debug("Starting audio playback immediately...")
+            self._play_sound(sound, timeout=8.0)
             
-            print(f"[Voice] Speech generated and played successfully!")
+            log.debug("Speech generated and played successfully!")
             
         except Exception as e:
             print(f"[Voice] ElevenLabs API error: {e}")
             print("[Voice] Falling back to mock speech...")
             self._generate_mock_speech(text)
     
+    def _play_sound(self, sound, timeout: float):
+        """Play a preloaded pygame Sound and wait for it to finish."""
+        channel = sound.play()
+        if channel is None:
+            print("[Voice] No free mixer channel for playback")
+            return
+        
+        start_time = time.time()
+        while channel.get_busy() and (time.time() - start_time) < timeout:
+            time.sleep(0.05)
+        
+        # Force stop if still playing
+        if channel.get_busy():
+            channel.stop()
+            print("[Voice] Audio playback stopped (timeout)")
+    
+    def _synthesize_elevenlabs(self, text: str) -> bytes:
+        """Synthesize text with ElevenLabs, serving repeated phrases from the LRU cache."""
+        from config import Config
+        
+        voice_id = self._voice_id or Config.VOICE_ID or "21m00Tcm4TlvDq8ikWAM"
+        key = (voice_id, text.strip().lower())
+        
+        with self._tts_cache_lock:
+            audio_bytes = self._tts_cache.get(key)
+            if audio_bytes is not None:
+                self._tts_cache.move_to_end(key)
+                log.debug("Using cached speech for: '%s'", text)
+                return audio_bytes
+        
+        # Use pre-warmed client for faster response
+        client = self._get_elevenlabs_client()
+        log.debug("Calling ElevenLabs API with voice ID: %s", voice_id)
+        audio_stream = client.text_to_speech.convert(
+            voice_id=voice_id,
+            text=text,
+            output_format="mp3_44100_64",  # Lower bitrate for faster processing
+            model_id="eleven_multilingual_v2",
+            voice_settings={
+                "stability": 0.5,  # Lower stability for faster generation
+                "similarity_boost": 0.5  # Lower similarity for speed
+            }
+        )
+        audio_bytes = b''.join(audio_stream)
+        
+        with self._tts_cache_lock:
+            self._tts_cache[key] = audio_bytes
+            self._tts_cache.move_to_end(key)
+            while len(self._tts_cache) > self._tts_cache_size:
+                self._tts_cache.popitem(last=False)
+        
+        return audio_bytes
+    
     def _generate_mock_speech(self, text: str):
         """Generate mock speech using pygame."""
         try:
-            print(f"[Voice] Using mock speech generation... *click*")
+            log.debug("Using mock speech generation...")
             
-            # Generate a simple audio tone
-            duration = len(text) * 0.1  # Rough estimate of speech duration
-            
-            # Create a simple tone
-            sample_rate = 44100
+            # Generate a simple audio tone (playback is capped at 5 seconds anyway)
+            duration = min(len(text) * 0.1, 5.0)  # Rough estimate of speech duration
             frequency = 440  # A4 note
             
-            # Generate sine wave
-            import numpy as np
-            t = np.linspace(0, duration, int(sample_rate * duration), False)
-            tone = np.sin(2 * np.pi * frequency * t)
-            
-            # Convert to 16-bit integer
-            tone = (tone * 32767).astype(np.int16)
-            
-            # Save as temporary WAV file
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                import wave
-                with wave.open(temp_file.name, 'wb') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)
-                    wav_file.setframerate(sample_rate)
-                    wav_file.writeframes(tone.tobytes())
-                
-                # Play the audio
-                try:
-                    pygame.mixer.music.load(temp_file.name)
-                    pygame.mixer.music.play()
-                    
-                    # Wait for audio to finish with timeout
-                    import time
-                    start_time = time.time()
-                    timeout = 5.0  # 5 second timeout for mock speech
-                    
-                    while pygame.mixer.music.get_busy() and (time.time() - start_time) < timeout:
-                        time.sleep(0.1)
-                    
-                    # Force stop if still playing
-                    if pygame.mixer.music.get_busy():
-                        pygame.mixer.music.stop()
-                        print("[Voice] Mock audio playback stopped (timeout)")
-                        
-                except Exception as e:
-                    print(f"[Voice] Error playing audio: {e}")
-                finally:
-                    # Clean up temporary file
-                    import os
-                    try:
-                        os.unlink(temp_file.name)
-                    except:
-                        pass
+            # Play directly from memory - no WAV file round-trip; repeated lengths reuse the Sound
+            try:
+                sound = _mock_tone_sound(round(duration, 1), frequency)
+                self._play_sound(sound, timeout=5.0)
+            except Exception as e:
+                print(f"[Voice] Error playing audio: {e}")
                         
         except Exception as e:
             print(f"[Voice] Error in mock speech: {e}")
             # Fallback: just wait
-            import time
             time.sleep(min(len(text) * 0.05, 2.0))
     
     def play_audio_file(self, file_path: str):
@@ -559,20 +735,32 @@ class VoiceHandler:
             print(f"[Voice] Error recording audio: {e}")
             return False
     
+    def _enumerate_input_devices(self, refresh: bool = False) -> Dict[int, Dict]:
+        """Return {device_index: device_info} for input-capable devices, cached after the first scan."""
+        if self._input_devices is None or refresh:
+            devices = {}
+            for i in range(self.audio.get_device_count()):
+                try:
+                    info = self.audio.get_device_info_by_index(i)
+                except Exception:
+                    continue
+                if info['maxInputChannels'] > 0:
+                    devices[i] = info
+            self._input_devices = devices
+        return self._input_devices
+    
     def get_available_microphones(self) -> List[Dict[str, any]]:
         """Get list of available microphones."""
         try:
-            mic_list = []
-            for i in range(self.audio.get_device_count()):
-                device_info = self.audio.get_device_info_by_index(i)
-                if device_info['maxInputChannels'] > 0:
-                    mic_list.append({
-                        'index': i,
-                        'name': device_info['name'],
-                        'channels': device_info['maxInputChannels'],
-                        'sample_rate': device_info['defaultSampleRate']
-                    })
-            return mic_list
+            return [
+                {
+                    'index': i,
+                    'name': info['name'],
+                    'channels': info['maxInputChannels'],
+                    'sample_rate': info['defaultSampleRate']
+                }
+                for i, info in self._enumerate_input_devices().items()
+            ]
         except Exception as e:
             print(f"[Voice] Error getting microphone list: {e}")
             return []
@@ -580,9 +768,8 @@ class VoiceHandler:
     def set_microphone(self, device_index: int):
         """Set the microphone device to use."""
         try:
-            mic_list = self.get_available_microphones()
-            if any(mic['index'] == device_index for mic in mic_list):
-                self.microphone = sr.Microphone(device_index=device_index)
+            if device_index in self._enumerate_input_devices():
+                self.microphone = self._create_microphone(device_index)
                 print(f"[Voice] Microphone set to device {device_index}")
                 return True
             else:
@@ -596,11 +783,19 @@ class VoiceHandler:
         """Clean up audio resources."""
         try:
             self.stop_listening()
+            self._stop_processors()
             
             if hasattr(self, 'audio'):
                 self.audio.terminate()
             
-            pygame.mixer.quit()
+            if pygame is not None:
+                # Cached tones belong to this mixer; a re-initialized one needs fresh Sounds
+                _mock_tone_sound.cache_clear()
+                pygame.mixer.quit()
+            
+            if self._http is not None:
+                self._http.close()
+                self._http = None
             
             print("[Voice] Audio resources cleaned up")
             
@@ -610,26 +805,75 @@ class VoiceHandler:
     def _pre_warm_elevenlabs(self):
         """Pre-warm ElevenLabs client for faster responses."""
         try:
-            from elevenlabs import ElevenLabs
             from config import Config
             
-            if Config.ELEVENLABS_API_KEY and Config.ELEVENLABS_API_KEY != "your_elevenlabs_api_key_here":
+            # Same gate as speech output: no network traffic in DEV_MODE or with a placeholder key
+            if self._should_use_real_tts():
                 print("[Voice] Pre-warming ElevenLabs client for faster responses...")
-                self._elevenlabs_client = ElevenLabs(api_key=Config.ELEVENLABS_API_KEY)
                 self._voice_id = Config.VOICE_ID or "21m00Tcm4TlvDq8ikWAM"
+                self._elevenlabs_client = self._build_elevenlabs_client()
+                self._warm_elevenlabs_connection()
                 print(f"[Voice] ElevenLabs client pre-warmed with voice ID: {self._voice_id}")
+                
+                # Pre-render canned phrases so common replies skip the network
+                for phrase in Config.CANNED_PHRASES:
+                    try:
+                        self._synthesize_elevenlabs(phrase)
+                    except Exception as e:
+                        print(f"[Voice] Could not pre-render '{phrase}': {e}")
             else:
-                print("[Voice] ElevenLabs API key not configured, skipping pre-warm")
+                print("[Voice] ElevenLabs speech not in use, skipping pre-warm")
                 
         except Exception as e:
             print(f"[Voice] Error pre-warming ElevenLabs: {e}")
+        finally:
+            self._prewarm_done.set()
+    
+    def _get_http_client(self):
+        """Get the shared keep-alive HTTP client used for ElevenLabs requests."""
+        with self._http_lock:
+            if self._http is None:
+                import httpx
+                limits = httpx.Limits(max_keepalive_connections=4)
+                try:
+                    self._http = httpx.Client(http2=True, timeout=10.0, limits=limits)
+                except ImportError:
+                    # 'h2' not installed - HTTP/1.1 keep-alive still avoids per-call handshakes
+                    self._http = httpx.Client(timeout=10.0, limits=limits)
+            return self._http
+    
+    def _build_elevenlabs_client(self):
+        """Create an ElevenLabs client that reuses the shared HTTP connection pool."""
+        from elevenlabs import ElevenLabs
+        from config import Config
+        
+        try:
+            return ElevenLabs(api_key=Config.ELEVENLABS_API_KEY, httpx_client=self._get_http_client())
+        except TypeError:
+            # Older SDKs do not accept a custom httpx client
+            return ElevenLabs(api_key=Config.ELEVENLABS_API_KEY)
+    
+    def _warm_elevenlabs_connection(self):
+        """Open the TLS session ahead of the first synthesis request."""
+        from config import Config
+        
+        try:
+            self._get_http_client().get(
+                f"https://api.elevenlabs.io/v1/voices/{self._voice_id}",
+                headers={"xi-api-key": Config.ELEVENLABS_API_KEY},
+            )
+        except Exception as e:
+            print(f"[Voice] ElevenLabs connection warm-up failed: {e}")
     
     def _get_elevenlabs_client(self):
         """Get pre-warmed ElevenLabs client or create new one."""
         if self._elevenlabs_client:
             return self._elevenlabs_client
         
+        # Give the background pre-warm a chance to finish first
+        if self._prewarm_done.wait(timeout=2.0) and self._elevenlabs_client:
+            return self._elevenlabs_client
+        
         # Fallback to creating new client
-        from elevenlabs import ElevenLabs
-        from config import Config
-        return ElevenLabs(api_key=Config.ELEVENLABS_API_KEY)
+        self._elevenlabs_client = self._build_elevenlabs_client()
+        return self._elevenlabs_client
@@ -1,21 +1,111 @@
+import functools
+import io
+import json
+import math
 import threading
 import time
-import tempfile
 import os
+import queue
 import numpy as np
-import wave
 import pyaudio
 import pygame
 import speech_recognition as sr
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, List, Dict
 from config import Config
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+class _AudioRing:
+    """
+    Single-producer/single-consumer ring of int16 samples.
+    The PortAudio callback writes, the listen thread reads; indices only grow
+    and are masked into the power-of-two buffer.
+    """
+
+    def __init__(self, min_samples: int):
+        size = 1 << max(1, min_samples - 1).bit_length()
+        self._buf = np.zeros(size, dtype=np.int16)
+        self._mask = size - 1
+        self.write_idx = 0
+        self.read_idx = 0
+        self.data_ready = threading.Event()
+
+    def write(self, samples: np.ndarray):
+        n = min(samples.size, self._buf.size)
+        start = self.write_idx & self._mask
+        first = min(n, self._buf.size - start)
+        self._buf[start:start + first] = samples[:first]
+        self._buf[:n - first] = samples[first:n]
+        self.write_idx += n
+        self.data_ready.set()
+
+    def read(self, n: int, timeout: float) -> Optional[np.ndarray]:
+        """Return the next n samples, or None if they did not arrive within timeout."""
+        while self.write_idx - self.read_idx < n:
+            self.data_ready.clear()
+            if self.write_idx - self.read_idx >= n:
+                break
+            if not self.data_ready.wait(timeout):
+                return None
+        read_idx = self.read_idx
+        if self.write_idx - read_idx > self._buf.size:
+            # Overrun: the producer lapped us, skip to the oldest intact samples
+            read_idx = self.write_idx - self._buf.size
+        start = read_idx & self._mask
+        first = min(n, self._buf.size - start)
+        out = np.empty(n, dtype=np.int16)
+        out[:first] = self._buf[start:start + first]
+        out[first:] = self._buf[:n - first]
+        self.read_idx = read_idx + n
+        return out
+
+    def discard(self):
+        """Drop everything buffered so far (consumer side only)."""
+        self.read_idx = self.write_idx
+
+
+def _frame_energy(samples: np.ndarray) -> float:
+    """Mean squared amplitude of int16 PCM samples, accumulated in int64 without a float copy."""
+    if not samples.size:
+        return 0.0
+    return float(np.einsum("i,i->", samples, samples, dtype=np.int64)) / samples.size
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _frame_energy(samples):  # noqa: F811 - JIT replacement for the NumPy version above
+        if samples.size == 0:
+            return 0.0
+        acc = 0.0
+        for x in samples:
+            acc += float(x) * float(x)
+        return acc / samples.size
+
+
+@functools.lru_cache(maxsize=8)
+def _mock_tone_sound(duration: float, frequency: int) -> "pygame.mixer.Sound":
+    """Mock-speech tone rendered once per duration, in the mixer's own rate/channel layout."""
+    sample_rate, _, channels = pygame.mixer.get_init()
+    # One period of the tone, tiled to length instead of evaluating sin for every sample
+    period = int(sample_rate / frequency)
+    cycle = (np.sin(2 * np.pi * np.arange(period) / period) * 32767).astype(np.int16)
+    nsamp = int(sample_rate * duration)
+    tone = np.tile(cycle, nsamp // period + 1)[:nsamp]
+    if channels > 1:
+        tone = np.repeat(tone, channels)
+    return pygame.mixer.Sound(buffer=tone.tobytes())
+
 
 class VoiceHandlerV2:
     """
     Voice handler inspired by the reference chatbot pipeline:
-    - Opens a raw PyAudio stream and performs RMS-based VAD
+    - Opens a raw PyAudio stream and performs RMS-based VAD, confirmed by Silero when installed
     - Keeps the mic hot until the user stops speaking
     - Blocks listening while playback runs to avoid echo
     """
@@ -24,8 +114,22 @@ class VoiceHandlerV2:
     MIN_SPEECH_MS = 300
     END_SILENCE_MS = int(os.getenv('END_SILENCE_MS', '400'))  # Configurable silence duration before processing (ms)
     MAX_RECORDING_MS = 15000
-    BASE_THRESHOLD = 120.0
+    MIC_CACHE_PATH = os.path.expanduser("~/.cache/voice_v2_mic.json")
+    RING_MS = 500  # Capture ring headroom between the audio callback and the listen thread
+    # Speech probability from dBFS-normalized RMS: p = clip((dBFS + 100) / 100, 0, 1)
+    P_ENTER_MIN = 0.35  # Lowest probability that can start a recording
+    P_EXIT_MIN = 0.2  # Lowest probability below which a frame counts as silence
+    P_ENTER_MARGIN = 0.15  # Enter threshold above the ambient median
+    P_EXIT_MARGIN = 0.05  # Exit threshold above the ambient median
+    # Silero VAD probabilities; only consulted for frames that already pass the RMS gate
+    SILERO_ENTER = 0.5
+    SILERO_EXIT = 0.35
+    SILERO_WINDOW = {16000: 512, 8000: 256}  # Samples per inference the model accepts
     POST_PROCESSING_COOLDOWN_MS = 1000  # Cooldown after processing audio to prevent immediate re-triggering
+    MOCK_FREQUENCY = 440
+    PLAYBACK_POLL_S = 0.02  # get_busy() poll while waiting for playback to end
+    # Same endpoint speech_recognition's recognize_google uses
+    GOOGLE_STT_URL = "https://www.google.com/speech-api/v2/recognize"
 
     def __init__(self):
         self.callback: Optional[Callable[[str], None]] = None
@@ -34,6 +138,8 @@ class VoiceHandlerV2:
         self.recognizer = sr.Recognizer()
         self.audio = pyaudio.PyAudio()
         self.stream = None
+        self._ring: Optional[_AudioRing] = None
+        self._vad = None
 
         self.sample_rate = Config.SAMPLE_RATE
         self.channels = 1
@@ -46,17 +152,46 @@ class VoiceHandlerV2:
         self._playback_active = False
         self._playback_end_time = 0.0
         self._last_processing_time = 0.0  # Track when we last processed audio
-        self._last_callback_time = 0.0  # Track when we last called the callback
+        self._play_done = threading.Event()  # Set by cleanup() to cut a playback wait short
+        self._epoch = 0  # Bumped by every speak_text; recordings from an older epoch are stale
 
         self._elevenlabs_client = None
         self._voice_id = None
+        self._http = None
+        self._http_lock = threading.Lock()  # Both STT workers and the pre-warm may create it
+        self._speech_client = None  # google-cloud-speech streaming client, when enabled
+        self._stt_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stt")
 
+        _frame_energy(np.zeros(1, dtype=np.int16))  # Trigger JIT compilation before the first frame
         self._init_stream()
+        self._init_vad()
+        self._init_streaming_stt()
+
+        # Capture scratch buffer sized for the longest recording, reused for every utterance
+        self._cap_frames = int(self.sample_rate * self.MAX_RECORDING_MS / 1000)
+        self._cap_buf = np.empty(self._cap_frames, dtype=np.int16)
+
         self._pre_warm_elevenlabs()
 
     # ------------------------------------------------------------------ setup
     def _init_stream(self):
-        """Open a PyAudio input stream, trying several rate/channel combos."""
+        """Open a PyAudio input stream, trying the cached config first, then several rate/channel combos."""
+        if not self._open_cached_stream():
+            self._probe_stream()
+
+        if not self.stream:
+            raise RuntimeError("Unable to open microphone stream. Adjust MIC settings or hardware.")
+
+        self.stream.start_stream()
+        self._calibrate_noise_floor()
+        try:
+            pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1)
+            print("[VoiceV2] Pygame mixer initialized")
+        except Exception as e:
+            print(f"[VoiceV2] Failed to initialize pygame mixer: {e}")
+
+    def _probe_stream(self):
+        """Scan candidate devices and rate/channel combos until a stream opens."""
         device_candidates: List[Optional[int]] = []
         if Config.MICROPHONE_INDEX is not None:
             device_candidates.append(Config.MICROPHONE_INDEX)
@@ -92,43 +227,179 @@ class VoiceHandlerV2:
                     if ch > max_channels:
                         continue
                     try:
-                        self.stream = self.audio.open(
-                            format=self.format,
-                            channels=ch,
-                            rate=rate,
-                            input=True,
-                            frames_per_buffer=int(rate * self.FRAME_MS / 1000),
-                            input_device_index=device_index,
-                        )
-                        self.sample_rate = rate
-                        self.channels = ch
-                        print(f"[VoiceV2] Mic stream opened at {rate}Hz/{ch}ch (device={device_index})")
+                        self._open_stream(device_index, rate, ch)
+                        self._save_mic_cache(device_index, info)
                         break
                     except Exception as e:
                         print(f"[VoiceV2] Mic stream failed for {rate}Hz/{ch}ch: {e}")
                 if self.stream:
                     break
 
-        if not self.stream:
-            raise RuntimeError("Unable to open microphone stream. Adjust MIC settings or hardware.")
+    def _open_stream(self, device_index: Optional[int], rate: int, ch: int):
+        self._ring = _AudioRing(int(rate * self.RING_MS / 1000))
+        self.stream = self.audio.open(
+            format=self.format,
+            channels=ch,
+            rate=rate,
+            input=True,
+            # Callback mode: let PortAudio pick its block size, the ring re-frames it
+            frames_per_buffer=pyaudio.paFramesPerBufferUnspecified,
+            input_device_index=device_index,
+            stream_callback=self._pa_cb,
+            start=False,
+        )
+        self.sample_rate = rate
+        self.channels = ch
+        print(f"[VoiceV2] Mic stream opened at {rate}Hz/{ch}ch (device={device_index})")
 
-        self._calibrate_noise_floor()
+    def _mic_cache_key(self, info: Optional[Dict]) -> List:
+        """Identify the hardware and settings a cached stream config is valid for."""
+        return [info.get("name") if info else None, Config.MICROPHONE_INDEX, Config.SAMPLE_RATE]
 
+    def _open_cached_stream(self) -> bool:
         try:
-            pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=self.channels)
-            print("[VoiceV2] Pygame mixer initialized")
+            with open(self.MIC_CACHE_PATH) as f:
+                cached = json.load(f)
+            device_index = cached["device_index"]
+            info = (
+                self.audio.get_device_info_by_index(device_index)
+                if device_index is not None
+                else self.audio.get_default_input_device_info()
+            )
+            if cached["key"] != self._mic_cache_key(info):
+                return False
+            self._open_stream(device_index, cached["rate"], cached["channels"])
+            return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
-            print(f"[VoiceV2] Failed to initialize pygame mixer: {e}")
+            print(f"[VoiceV2] Cached mic config unusable, probing: {e}")
+            self.stream = None
+            return False
+
+    def _save_mic_cache(self, device_index: Optional[int], info: Optional[Dict]):
+        try:
+            os.makedirs(os.path.dirname(self.MIC_CACHE_PATH), exist_ok=True)
+            with open(self.MIC_CACHE_PATH, "w") as f:
+                json.dump({
+                    "key": self._mic_cache_key(info),
+                    "device_index": device_index,
+                    "rate": self.sample_rate,
+                    "channels": self.channels,
+                }, f)
+        except OSError as e:
+            print(f"[VoiceV2] Could not cache mic config: {e}")
 
     def _calibrate_noise_floor(self):
         ambient = []
-        frame_bytes = int(self.sample_rate * self.FRAME_MS / 1000) * self.channels * 2
+        frame_samples = int(self.sample_rate * self.FRAME_MS / 1000)
         for _ in range(20):
-            data = self.stream.read(frame_bytes, exception_on_overflow=False)
-            samples = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-            ambient.append(np.sqrt(np.mean(samples * samples)))
+            samples = self._ring.read(frame_samples, timeout=1.0)
+            if samples is None:
+                break
+            ambient.append(math.sqrt(_frame_energy(samples)))
         self.noise_floor = float(np.median(ambient)) if ambient else 50.0
-        print(f"[VoiceV2] Noise floor calibrated to {self.noise_floor:.1f}")
+
+        # Hysteresis thresholds: start recording at p_hi, count silence below p_lo
+        ambient_p = self._rms_to_p(self.noise_floor)
+        self.p_hi = max(self.P_ENTER_MIN, ambient_p + self.P_ENTER_MARGIN)
+        self.p_lo = min(self.p_hi, max(self.P_EXIT_MIN, ambient_p + self.P_EXIT_MARGIN))
+        print(
+            f"[VoiceV2] Noise floor calibrated to {self.noise_floor:.1f} "
+            f"(p={ambient_p:.2f}, enter>{self.p_hi:.2f}, exit<{self.p_lo:.2f})"
+        )
+
+    def _elevate_consumer_thread(self):
+        """Run the calling thread SCHED_FIFO and pin it to AUDIO_CPU (SCHED_FIFO needs CAP_SYS_NICE).
+
+        Only the Python consumer that drains the ring is elevated; PortAudio's
+        callback thread that fills it is not ours to reschedule.
+        """
+        if not Config.AUDIO_RT_PRIORITY:
+            return
+        tid = threading.get_native_id()
+        try:
+            os.sched_setscheduler(tid, os.SCHED_FIFO, os.sched_param(20))
+            print("[VoiceV2] Audio consumer thread running SCHED_FIFO")
+        except (AttributeError, OSError) as e:
+            try:
+                os.setpriority(os.PRIO_PROCESS, tid, -10)
+                print("[VoiceV2] Audio consumer thread reniced to -10")
+            except (AttributeError, OSError):
+                print(f"[VoiceV2] Could not raise audio consumer thread priority: {e}")
+        if Config.AUDIO_CPU is not None:
+            try:
+                os.sched_setaffinity(tid, {Config.AUDIO_CPU})
+            except (AttributeError, OSError) as e:
+                print(f"[VoiceV2] Could not pin audio consumer thread to CPU {Config.AUDIO_CPU}: {e}")
+
+    def _init_streaming_stt(self):
+        """Use google-cloud-speech streaming recognition when STT_ENGINE=google_cloud."""
+        if Config.STT_ENGINE != "google_cloud":
+            return
+        try:
+            from google.cloud import speech
+            self._speech_client = speech.SpeechClient()
+            self._streaming_config = speech.StreamingRecognitionConfig(
+                config=speech.RecognitionConfig(
+                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                    sample_rate_hertz=self.sample_rate,
+                    language_code="en-US",
+                ),
+            )
+            self._speech = speech
+            print("[VoiceV2] Streaming Google Cloud STT enabled")
+        except ImportError:
+            print("[VoiceV2] google-cloud-speech not installed, using Google web STT")
+        except Exception as e:
+            print(f"[VoiceV2] Warning: Could not initialize streaming STT, using Google web STT: {e}")
+
+    def _init_vad(self):
+        """Load Silero VAD (ONNX) as a second stage behind the RMS gate, if available."""
+        if not Config.SILERO_VAD:
+            return
+        window = self.SILERO_WINDOW.get(self.sample_rate)
+        if window is None:
+            print(f"[VoiceV2] Silero VAD unavailable at {self.sample_rate} Hz, using RMS only")
+            return
+        try:
+            import torch
+            from silero_vad import load_silero_vad
+            self._vad = load_silero_vad(onnx=True)
+            self._torch = torch
+            self._vad_window = np.zeros(window, dtype=np.float32)
+            print("[VoiceV2] Silero VAD enabled")
+        except ImportError:
+            print("[VoiceV2] silero-vad not installed, using RMS VAD only")
+        except Exception as e:
+            print(f"[VoiceV2] Warning: Could not initialize Silero VAD: {e}")
+
+    def _speech_prob(self, samples: np.ndarray) -> float:
+        """Silero speech probability for the model window ending with this frame."""
+        win = self._vad_window
+        n = min(samples.size, win.size)
+        win[:-n] = win[n:]
+        win[-n:] = samples[-n:] / 32768.0
+        return float(self._vad(self._torch.from_numpy(win), self.sample_rate).item())
+
+    def _pa_cb(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: copy the block into the ring (downmixed to mono) and return immediately."""
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        if self.channels == 2:
+            samples = ((samples[0::2].astype(np.int32) + samples[1::2]) >> 1).astype(np.int16)
+        self._ring.write(samples)
+        return (None, pyaudio.paContinue)
+
+    @staticmethod
+    def _rms_to_p(rms: float) -> float:
+        """Map RMS amplitude to a [0, 1] speech probability via dBFS."""
+        return max(0.0, min(1.0, (20 * math.log10(rms / 32768 + 1e-12) + 100) / 100))
+
+    @staticmethod
+    def _p_to_mean_square(p: float) -> float:
+        """Inverse of _rms_to_p, expressed as mean squared amplitude for per-frame comparison."""
+        rms = 32768 * 10 ** ((p * 100 - 100) / 20)
+        return rms * rms
 
     # ------------------------------------------------------------------ public API
     def set_callback(self, callback: Callable[[str], None]):
@@ -157,6 +428,7 @@ class VoiceHandlerV2:
         if self._playback_active or not text:
             return
         self._playback_active = True
+        self._epoch += 1
         try:
             self._simulate_speech(text)
         finally:
@@ -166,80 +438,102 @@ class VoiceHandlerV2:
 
     # ------------------------------------------------------------------ capture loop
     def _listen_loop(self):
-        frame_bytes = int(self.sample_rate * self.FRAME_MS / 1000) * self.channels * 2
-        # Use a higher threshold multiplier to reduce false positives from background noise
-        threshold = max(self.BASE_THRESHOLD, self.noise_floor * 2.5)
-
-        while not self._stop_event.is_set():
-            if self._should_block_listening():
+        self._elevate_consumer_thread()
+        frame_samples = int(self.sample_rate * self.FRAME_MS / 1000)
+        ring = self._ring
+        ring_read = ring.read
+        cap_buf = self._cap_buf
+        stop_is_set = self._stop_event.is_set
+        block = self._should_block_listening
+        speech_prob = self._speech_prob
+        frame_ms = self.FRAME_MS
+        max_ms = self.MAX_RECORDING_MS
+        end_sil = self.END_SILENCE_MS
+        min_sp = self.MIN_SPEECH_MS
+        cooldown_s = self.POST_PROCESSING_COOLDOWN_MS / 1000
+        silero_enter = self.SILERO_ENTER
+        silero_exit = self.SILERO_EXIT
+        # Hysteresis thresholds in the energy domain, so frames need no sqrt/log
+        enter_sq = self._p_to_mean_square(self.p_hi)
+        exit_sq = self._p_to_mean_square(self.p_lo)
+        vad = self._vad
+        # With Silero deciding onsets, RMS only has to reject frames that are clearly silent
+        onset_sq = exit_sq if vad is not None else enter_sq
+
+        while not stop_is_set():
+            if block():
+                ring.discard()  # Don't pick up our own playback once unblocked
+                if vad is not None:
+                    vad.reset_states()
                 time.sleep(0.05)
                 continue
 
             # Cooldown period after processing audio to prevent immediate re-triggering
-            time_since_last_processing = (time.time() * 1000) - (self._last_processing_time * 1000)
-            if time_since_last_processing < self.POST_PROCESSING_COOLDOWN_MS:
+            if time.time() - self._last_processing_time < cooldown_s:
+                ring.discard()
                 time.sleep(0.05)
                 continue
 
-            try:
-                chunk = self.stream.read(frame_bytes, exception_on_overflow=False)
-            except Exception as e:
-                print(f"[VoiceV2] Stream read error: {e}")
-                time.sleep(0.1)
+            samples = ring_read(frame_samples, 0.5)
+            if samples is None:
                 continue
 
-            samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
-            rms = float(np.sqrt(np.mean(samples * samples)))
-
-            if rms > threshold:
-                buffer = bytearray(chunk)
-                speech_ms = self.FRAME_MS
+            # Two-stage VAD: cheap RMS gate first, Silero only for frames loud enough to matter
+            if _frame_energy(samples) > onset_sq and (vad is None or speech_prob(samples) > silero_enter):
+                my_epoch = self._epoch
+                idx = samples.size
+                cap_buf[:idx] = samples
+                # Streaming STT: start the request at onset and feed frames as they are captured
+                stt_frames = None
+                if self._speech_client is not None:
+                    stt_frames = queue.Queue()
+                    stt_frames.put(samples.tobytes())
+                    self._stt_pool.submit(self._stream_recognize, stt_frames, my_epoch)
+                speech_ms = frame_ms
                 silence_ms = 0
-                total_ms = self.FRAME_MS
+                total_ms = frame_ms
 
-                while total_ms < self.MAX_RECORDING_MS and not self._stop_event.is_set():
-                    if self._should_block_listening():
+                while total_ms < max_ms and not stop_is_set():
+                    if block():
+                        ring.discard()
                         time.sleep(0.05)
                         continue
-                    chunk = self.stream.read(frame_bytes, exception_on_overflow=False)
-                    samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
-                    rms = float(np.sqrt(np.mean(samples * samples)))
-                    buffer.extend(chunk)
-                    total_ms += self.FRAME_MS
-
-                    if rms < threshold:
-                        silence_ms += self.FRAME_MS
+                    samples = ring_read(frame_samples, 0.5)
+                    if samples is None:
+                        break
+                    n = min(samples.size, cap_buf.size - idx)
+                    cap_buf[idx:idx + n] = samples[:n]
+                    idx += n
+                    total_ms += frame_ms
+                    if stt_frames is not None:
+                        stt_frames.put(samples.tobytes())
+
+                    # Stay in speech until energy drops below the lower exit threshold
+                    if _frame_energy(samples) < exit_sq or (vad is not None and speech_prob(samples) < silero_exit):
+                        silence_ms += frame_ms
                     else:
                         silence_ms = 0
-                        speech_ms += self.FRAME_MS
+                        speech_ms += frame_ms
 
-                    if silence_ms >= self.END_SILENCE_MS and speech_ms >= self.MIN_SPEECH_MS:
+                    if silence_ms >= end_sil and speech_ms >= min_sp:
                         break
 
-                if buffer:
-                    audio_data = sr.AudioData(bytes(buffer), self.sample_rate, 2)
+                if stt_frames is not None:
+                    stt_frames.put(None)  # End of utterance closes the request stream
+                    self._last_processing_time = time.time()
+                elif idx:
+                    # Snapshot the PCM: cap_buf is overwritten by the next recording while STT runs
+                    pcm = cap_buf[:idx].tobytes()
                     self._last_processing_time = time.time()  # Mark when we start processing
-                    threading.Thread(
-                        target=self._process_audio,
-                        args=(audio_data,),
-                        daemon=True
-                    ).start()
-
-    def _process_audio(self, audio: sr.AudioData):
-        if self._should_block_listening():
-            return
-        
-        # Debounce: Don't process if we just called the callback recently (within 1 second)
-        current_time = time.time()
-        if current_time - self._last_callback_time < 1.0:
+                    self._stt_pool.submit(self._process_audio, pcm, my_epoch)
+
+    def _process_audio(self, pcm: bytes, epoch: int):
+        # Skip STT entirely for audio recorded before the robot last spoke
+        if epoch != self._epoch or self._should_block_listening():
             return
-        
+
         try:
-            text = self.recognizer.recognize_google(audio)
-            if text and self.callback:
-                print(f"[VoiceV2] Recognized: {text}")
-                self._last_callback_time = current_time
-                self.callback(text)
+            self._deliver_text(self._recognize_google_pcm(pcm), epoch)
         except sr.UnknownValueError:
             print("[VoiceV2] Could not understand audio")
         except sr.RequestError as e:
@@ -247,6 +541,86 @@ class VoiceHandlerV2:
         except Exception as e:
             print(f"[VoiceV2] Processing error: {e}")
 
+    def _stream_recognize(self, frames: "queue.Queue[Optional[bytes]]", epoch: int):
+        """Run one streaming recognition while _listen_loop is still capturing the utterance."""
+        speech = self._speech
+        ended = False  # Set once requests() has taken the end-of-utterance sentinel
+
+        def requests():
+            nonlocal ended
+            while (chunk := frames.get()) is not None:
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+            ended = True
+
+        try:
+            responses = self._speech_client.streaming_recognize(self._streaming_config, requests())
+            for response in responses:
+                for result in response.results:
+                    if result.is_final and result.alternatives:
+                        self._deliver_text(result.alternatives[0].transcript, epoch)
+        except Exception as e:
+            print(f"[VoiceV2] Speech service error: {e}")
+            if ended:
+                return  # Capture already finished; another get() would block this worker forever
+            # Drop what capture still sends for this utterance, but never wait past its longest length
+            deadline = time.monotonic() + self.MAX_RECORDING_MS / 1000 + 1.0
+            try:
+                while frames.get(timeout=max(0.0, deadline - time.monotonic())) is not None:
+                    pass
+            except queue.Empty:
+                pass
+
+    def _deliver_text(self, text: str, epoch: int):
+        if epoch != self._epoch:
+            return  # The robot started speaking while this request was in flight
+        if text and self.callback:
+            print(f"[VoiceV2] Recognized: {text}")
+            self.callback(text)
+
+    def _recognize_google_pcm(self, pcm: bytes) -> str:
+        """Send raw int16 PCM to Google STT as audio/l16 (no FLAC re-encode) when GOOGLE_STT_API_KEY is set."""
+        if not Config.GOOGLE_STT_API_KEY:
+            # No key of our own: let speech_recognition apply its built-in one (FLAC path)
+            return self.recognizer.recognize_google(sr.AudioData(pcm, self.sample_rate, 2))
+
+        import httpx
+
+        try:
+            response = self._get_http_client().post(
+                self.GOOGLE_STT_URL,
+                params={"client": "chromium", "lang": "en-US", "key": Config.GOOGLE_STT_API_KEY, "output": "json"},
+                headers={"Content-Type": f"audio/l16; rate={self.sample_rate}"},
+                content=pcm,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise sr.RequestError(f"recognition request failed: {e}")
+
+        # The body is one JSON object per line; the first is usually an empty result
+        for line in response.text.splitlines():
+            if not line:
+                continue
+            results = json.loads(line).get("result")
+            if not results:
+                continue
+            alternatives = results[0].get("alternative") or []
+            if alternatives and alternatives[0].get("transcript"):
+                return alternatives[0]["transcript"]
+        raise sr.UnknownValueError()
+
+    def _get_http_client(self):
+        """Shared keep-alive HTTP client for STT and ElevenLabs requests."""
+        with self._http_lock:
+            if self._http is None:
+                import httpx
+                limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0)
+                try:
+                    self._http = httpx.Client(http2=True, timeout=10.0, limits=limits)
+                except ImportError:
+                    # 'h2' not installed - HTTP/1.1 keep-alive still avoids per-call handshakes
+                    self._http = httpx.Client(timeout=10.0, limits=limits)
+            return self._http
+
     def _should_block_listening(self) -> bool:
         now = time.time()
         if self._playback_active or now < self._playback_end_time:
@@ -274,13 +648,11 @@ class VoiceHandlerV2:
     def _should_use_real_tts(self) -> bool:
         return (
             Config.ELEVENLABS_API_KEY
-            and Config.ELEVENLABS_API_KEY != "your_elevenlabs_api_key_here"
+            and Config.ELEVENLABS_API_KEY not in ("your_elevenlabs_api_key_here", "mock_elevenlabs_key")
             and not Config.DEV_MODE
         )
 
     def _generate_real_speech(self, text: str):
-        from elevenlabs import ElevenLabs
-
         client = self._get_elevenlabs_client()
         voice_id = self._voice_id or Config.VOICE_ID or "21m00Tcm4TlvDq8ikWAM"
         audio_stream = client.text_to_speech.convert(
@@ -290,74 +662,79 @@ class VoiceHandlerV2:
             model_id="eleven_multilingual_v2",
             voice_settings={"stability": 0.5, "similarity_boost": 0.5},
         )
-        audio_bytes = b"".join(audio_stream)
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-            tmp.write(audio_bytes)
-            path = tmp.name
+        buf = io.BytesIO()
+        buf.writelines(audio_stream)
+        buf.seek(0)
         try:
-            pygame.mixer.music.load(path)
+            pygame.mixer.music.load(buf, "mp3")
             pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.05)
+            self._wait_for_playback(pygame.mixer.music.get_busy, timeout=60.0)
         finally:
             pygame.mixer.music.stop()
-            try:
-                os.unlink(path)
-            except Exception:
-                pass
 
     def _generate_mock_speech(self, text: str):
         duration = max(1.0, min(len(text) * 0.05, 5.0))
-        sample_rate = 44100
-        frequency = 440
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        tone = (np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            with wave.open(tmp.name, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(tone.tobytes())
-            path = tmp.name
+        sound = _mock_tone_sound(round(duration, 1), self.MOCK_FREQUENCY)
+        channel = sound.play()
+        if channel is None:
+            return
         try:
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.05)
+            self._wait_for_playback(channel.get_busy, timeout=duration + 1.0)
         finally:
-            pygame.mixer.music.stop()
-            try:
-                os.unlink(path)
-            except Exception:
-                pass
+            sound.stop()
+
+    def _wait_for_playback(self, is_busy: Callable[[], bool], timeout: float):
+        """Block until playback ends, polling get_busy() rather than touching SDL's display or event queue."""
+        deadline = time.monotonic() + timeout
+        while is_busy():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._play_done.wait(min(self.PLAYBACK_POLL_S, remaining)):
+                break  # cleanup() is tearing the mixer down
 
     # ------------------------------------------------------------------ utilities
     def cleanup(self):
         try:
             self.stop_listening()
+            self._stt_pool.shutdown(wait=False)
+            self._play_done.set()
             if self.stream:
                 self.stream.stop_stream()
                 self.stream.close()
             if hasattr(self, "audio"):
                 self.audio.terminate()
+            # Cached tones belong to this mixer; a re-initialized one needs fresh Sounds
+            _mock_tone_sound.cache_clear()
             pygame.mixer.quit()
+            if self._http is not None:
+                self._http.close()
+                self._http = None
             print("[VoiceV2] Resources cleaned up")
         except Exception as e:
             print(f"[VoiceV2] Cleanup error: {e}")
 
     def _pre_warm_elevenlabs(self):
+        # Same gate as speech output: no client or connection pool in DEV_MODE or with a placeholder key
+        if not self._should_use_real_tts():
+            print("[VoiceV2] ElevenLabs speech not in use, skipping pre-warm")
+            return
         try:
             from elevenlabs import ElevenLabs
-            if Config.ELEVENLABS_API_KEY and Config.ELEVENLABS_API_KEY != "your_elevenlabs_api_key_here":
-                print("[VoiceV2] Pre-warming ElevenLabs client...")
+            print("[VoiceV2] Pre-warming ElevenLabs client...")
+            try:
+                self._elevenlabs_client = ElevenLabs(
+                    api_key=Config.ELEVENLABS_API_KEY, httpx_client=self._get_http_client()
+                )
+            except TypeError:
+                # Older SDKs do not accept a custom httpx client
                 self._elevenlabs_client = ElevenLabs(api_key=Config.ELEVENLABS_API_KEY)
-                self._voice_id = Config.VOICE_ID or "21m00Tcm4TlvDq8ikWAM"
+            self._voice_id = Config.VOICE_ID or "21m00Tcm4TlvDq8ikWAM"
         except Exception as e:
             print(f"[VoiceV2] ElevenLabs pre-warm failed: {e}")
 
     def _get_elevenlabs_client(self):
-        if self._elevenlabs_client:
-            return self._elevenlabs_client
-        from elevenlabs import ElevenLabs
-        return ElevenLabs(api_key=Config.ELEVENLABS_API_KEY)
+        if self._elevenlabs_client is None:
+            raise RuntimeError("ElevenLabs client unavailable (pre-warm failed)")
+        return self._elevenlabs_client
 
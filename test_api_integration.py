@@ -3,9 +3,9 @@
 Test script to verify SPARK's API integration.
 """
 
-import sys
 import asyncio
-sys.path.insert(0, 'src')
+
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
 
 from config import Config
 from persona import RobotPersona
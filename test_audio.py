@@ -6,6 +6,8 @@ Tests if audio packages are working correctly.
 
 import sys
 
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
+
 def test_imports():
     """Test if audio packages can be imported."""
     print("🧪 Testing audio package imports...")
@@ -3,10 +3,10 @@
 Test script to demonstrate SPARK's global control functionality.
 """
 
-import sys
 import time
 import threading
-sys.path.insert(0, 'src')
+
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
 
 from config import Config
 from persona import RobotPersona
@@ -52,9 +52,9 @@ def test_global_control():
             try:
                 # Show status
                 stats = robot_state.get_stats()
-                status = "PAUSED" if stats['is_paused'] else "ACTIVE"
+                status = "PAUSED" if stats.is_paused else "ACTIVE"
                 voice_status = "VOICE ON" if voice_handler.is_listening else "VOICE OFF"
-                print(f"\r[Status] {status} | {voice_status} | Battery: {stats['battery_level']:.1f}% | Count: {count}", end="")
+                print(f"\r[Status] {status} | {voice_status} | Battery: {stats.battery_level:.1f}% | Count: {count}", end="")
                 
                 count += 1
                 time.sleep(0.1)
@@ -4,49 +4,131 @@ Test script to check if keyboard input detection is working.
 """
 
 import sys
+import os
 import time
 import threading
 
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
+
+STD_INPUT_HANDLE = -10
+WAIT_OBJECT_0 = 0
+
+def _kbhit_poll(timeout_ms=100):
+    """Fallback Windows reader: poll msvcrt.kbhit() until a key arrives or the timeout elapses."""
+    import msvcrt
+    deadline = time.monotonic() + timeout_ms / 1000
+    while time.monotonic() < deadline:
+        if msvcrt.kbhit():
+            return msvcrt.getch().decode('utf-8', 'replace')
+        time.sleep(0.01)
+    return None
+
+def _win_backend(timeout_ms=100):
+    """Look up the console input handle once; return a key reader that sleeps on it instead of spinning on kbhit()."""
+    import ctypes
+    import msvcrt
+    k32 = ctypes.windll.kernel32
+    k32.GetStdHandle.restype = ctypes.c_void_p
+    handle = k32.GetStdHandle(STD_INPUT_HANDLE)
+    if not handle or handle == ctypes.c_void_p(-1).value:  # NULL or INVALID_HANDLE_VALUE
+        return _kbhit_poll
+    handle = ctypes.c_void_p(handle)
+    
+    def read_key():
+        if k32.WaitForSingleObject(handle, timeout_ms) == WAIT_OBJECT_0:
+            if msvcrt.kbhit():
+                return msvcrt.getch().decode('utf-8', 'replace')
+            # Signalled by mouse/focus/key-up records; drop them so the next wait blocks again
+            k32.FlushConsoleInputBuffer(handle)
+        return None
+    
+    return read_key
+
+def _posix_backend():
+    """Register stdin once with the platform's best selector (epoll/kqueue); return the key reader."""
+    import selectors
+    sel = selectors.DefaultSelector()
+    try:
+        sel.register(sys.stdin, selectors.EVENT_READ)
+    except PermissionError:
+        # epoll refuses regular files (stdin redirected from a file); plain select() accepts them
+        sel = selectors.SelectSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ)
+    fd = sys.stdin.fileno()
+    
+    def read_keys():
+        """Block until stdin is readable, then take everything buffered in one read (pastes, escape sequences).
+        
+        Returns '' at end of input (stdin closed or redirected from a file that ran out)."""
+        if sel.select(timeout=None):
+            return os.read(fd, 4096).decode('utf-8', 'replace')
+        return None
+    
+    return read_keys
+
+def _enter_cbreak():
+    """Put a terminal stdin into cbreak mode once; return a callable that restores it."""
+    if sys.platform == 'win32' or sys.stdin is None or not sys.stdin.isatty():
+        return lambda: None
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    return lambda: termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def _resolve_backend():
+    """Pick the key reader once rather than re-checking platform and imports per key."""
+    if sys.platform == 'win32':
+        # select() only accepts sockets on Windows; wait on the console handle
+        return _win_backend()
+    return _posix_backend()
+
 def test_input_detection():
     """Test basic input detection."""
     print("Testing input detection...")
     print("Press SPACE to pause, 'q' to quit, or any other key to test")
     print("=" * 50)
     
+    done = threading.Event()
+    
     def input_loop():
-        while True:
+        try:
             try:
-                # Try select-based input detection
-                import select
-                if select.select([sys.stdin], [], [], 0.1)[0]:
-                    key = sys.stdin.read(1)
-                    if key == ' ':
-                        print("✅ SPACE detected!")
-                    elif key == 'q':
-                        print("✅ 'q' detected! Exiting...")
-                        break
-                    else:
-                        print(f"✅ Key '{key}' detected!")
-                        
-            except ImportError:
-                # Try Windows-style input detection
+                read_key = _resolve_backend()
+            except (ImportError, OSError, ValueError) as e:
+                # No console/msvcrt, or a stdin without a usable fd (closed, replaced, io.UnsupportedOperation)
+                print(f"❌ No input detection method available: {e}")
+                return
+            
+            while True:
                 try:
-                    import msvcrt
-                    if msvcrt.kbhit():
-                        key = msvcrt.getch().decode('utf-8')
+                    keys = read_key()
+                    if keys is None:
+                        continue
+                    if not keys:
+                        # EOF: stdin stays "readable" forever, so stop instead of spinning on empty reads
+                        print("✅ End of input reached")
+                        return
+                    
+                    for key in keys:
                         if key == ' ':
                             print("✅ SPACE detected!")
                         elif key == 'q':
                             print("✅ 'q' detected! Exiting...")
-                            break
+                            return
                         else:
                             print(f"✅ Key '{key}' detected!")
-                except:
-                    print("❌ No input detection method available")
-                    break
-            except Exception as e:
-                print(f"❌ Input detection error: {e}")
-                break
+                            
+                except (OSError, ValueError) as e:
+                    print(f"❌ Input detection error: {e}")
+                    return
+        finally:
+            # However the reader ends, even on an unexpected exception, the main loop must not wait forever
+            done.set()
+    
+    # Keys arrive without waiting for Enter; restored on the way out
+    restore_terminal = _enter_cbreak()
     
     # Run input detection in a separate thread
     input_thread = threading.Thread(target=input_loop, daemon=True)
@@ -55,12 +137,16 @@ def test_input_detection():
     # Main loop with status updates
     try:
         count = 0
-        while input_thread.is_alive():
+        # Wakes as soon as the input thread finishes instead of at the next 1 s tick
+        while True:
             print(f"Waiting for input... ({count})", end='\r')
             count += 1
-            time.sleep(1)
+            if done.wait(1.0) or not input_thread.is_alive():
+                break
     except KeyboardInterrupt:
         print("\nInterrupted by user")
+    finally:
+        restore_terminal()
     
     print("\nInput test completed!")
 
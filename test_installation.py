@@ -6,62 +6,47 @@ Run this before starting the main application.
 
 import sys
 import os
+import asyncio
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
+
+# (label, module); flat names, the same ones the src modules use for each other
+IMPORT_CHECKS = [
+    ("Config", "config"),
+    ("Persona", "persona"),
+    ("Robot state", "robot_state"),
+    ("Conversation graph", "conversation_graph"),
+    ("Voice handler", "voice_handler"),
+    ("Terminal control", "control"),
+    ("Main", "main"),
+]
+
+def _import_module(module):
+    if importlib.util.find_spec(module) is None:
+        raise ImportError(f"No module named '{module}'")
+    return importlib.import_module(module)
 
 def test_imports():
     """Test if all required modules can be imported."""
     print("🧪 Testing module imports...")
     
-    try:
-        from src.config import Config
-        print("✅ Config module imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import config: {e}")
-        return False
-    
-    try:
-        from src.persona import RobotPersona
-        print("✅ Persona module imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import persona: {e}")
-        return False
-    
-    try:
-        from src.robot_state import RobotState
-        print("✅ Robot state module imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import robot_state: {e}")
-        return False
-    
-    try:
-        from src.conversation_graph import ConversationGraph
-        print("✅ Conversation graph module imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import conversation_graph: {e}")
-        return False
-    
-    try:
-        from src.voice_handler import VoiceHandler
-        print("✅ Voice handler module imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import voice_handler: {e}")
-        return False
-    
-    try:
-        from src.control import TerminalControl
-        print("✅ Terminal control module imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import control: {e}")
-        return False
+    # Import concurrently: the file reads overlap, only the final module bind is serialized
+    with ThreadPoolExecutor(max_workers=len(IMPORT_CHECKS)) as executor:
+        futures = [
+            (label, module, executor.submit(_import_module, module))
+            for label, module in IMPORT_CHECKS
+        ]
     
-    try:
-        from src.main import RobotAssistant
-        print("✅ Main module imported successfully")
-    except ImportError as e:
-        print(f"❌ Failed to import main: {e}")
-        return False
+    for label, module, future in futures:
+        try:
+            future.result()
+            print(f"✅ {label} module imported successfully")
+        except Exception as e:
+            print(f"❌ Failed to import {module}: {e}")
+            return False
     
     return True
 
@@ -70,7 +55,7 @@ def test_config():
     print("\n⚙️  Testing configuration...")
     
     try:
-        from src.config import Config
+        from config import Config
         
         # Test config validation
         issues = Config.validate()
@@ -95,7 +80,7 @@ def test_persona():
     print("\n🤖 Testing robot persona...")
     
     try:
-        from src.persona import RobotPersona
+        from persona import RobotPersona
         
         persona = RobotPersona()
         
@@ -116,7 +101,7 @@ def test_state():
     print("\n💾 Testing robot state...")
     
     try:
-        from src.robot_state import RobotState
+        from robot_state import RobotState
         
         state = RobotState(max_history=5)
         
@@ -135,8 +120,8 @@ def test_state():
         
         # Test stats
         stats = state.get_stats()
-        print(f"   Total interactions: {stats['total_interactions']}")
-        print(f"   Success rate: {stats['success_rate']:.1f}%")
+        print(f"   Total interactions: {stats.total_interactions}")
+        print(f"   Success rate: {stats.success_rate:.1f}%")
         
         print("✅ State test passed")
         return True
@@ -150,9 +135,9 @@ def test_conversation():
     print("\n🔄 Testing conversation workflow...")
     
     try:
-        from src.persona import RobotPersona
-        from src.robot_state import RobotState
-        from src.conversation_graph import ConversationGraph
+        from persona import RobotPersona
+        from robot_state import RobotState
+        from conversation_graph import ConversationGraph
         
         persona = RobotPersona()
         state = RobotState(max_history=3)
@@ -173,8 +158,13 @@ def test_voice_handler():
     """Test voice handler (basic initialization only)."""
     print("\n🎤 Testing voice handler...")
     
+    # No audio devices in CI; don't pay for PortAudio's device scan just to hit the text-only fallback
+    if os.environ.get("CI") or os.environ.get("ROBOT_NO_AUDIO"):
+        print("✅ Voice handler test skipped (no audio env)")
+        return True
+    
     try:
-        from src.voice_handler import VoiceHandler
+        from voice_handler import VoiceHandler
         
         # Note: Voice handler may fail on systems without audio devices
         # This is expected and not a critical failure
@@ -198,8 +188,8 @@ def test_control():
     print("\n⌨️  Testing terminal control...")
     
     try:
-        from src.robot_state import RobotState
-        from src.control import TerminalControl
+        from robot_state import RobotState
+        from control import TerminalControl
         
         state = RobotState(max_history=3)
         control = TerminalControl(state)
@@ -216,6 +206,13 @@ def test_control():
         print(f"❌ Terminal control test failed: {e}")
         return False
 
+async def _run_tests(tests):
+    """Run the independent tests side by side; each is blocking, so give each its own thread."""
+    return await asyncio.gather(
+        *(asyncio.to_thread(test_func) for _, test_func in tests),
+        return_exceptions=True,
+    )
+
 def main():
     """Run all tests."""
     print("🤖 SPARK Robot Assistant - Installation Test")
@@ -234,14 +231,17 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-            else:
-                print(f"❌ {test_name} failed")
-        except Exception as e:
-            print(f"❌ {test_name} crashed: {e}")
+    # Tests run concurrently, so their progress lines may interleave; the verdicts below are in order
+    results = asyncio.run(_run_tests(tests))
+    
+    print()
+    for (test_name, _), result in zip(tests, results):
+        if isinstance(result, BaseException):
+            print(f"❌ {test_name} crashed: {result}")
+        elif result:
+            passed += 1
+        else:
+            print(f"❌ {test_name} failed")
     
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {passed}/{total} tests passed")
@@ -256,7 +256,7 @@ def main():
         print("⚠️  Some tests failed. Please check the errors above.")
         print("💡 Common solutions:")
         print("   - Install missing dependencies: pip install -r requirements.txt")
-        print("   - Check Python version (3.8+ required)")
+        print("   - Check Python version (3.12+ required)")
         print("   - Verify file permissions")
     
     return passed == total
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Interactive harness for the main application.
+
+    python test_main_harness.py                     # terminal control only, no voice input
+    python test_main_harness.py --voice             # voice handler listening; pause must not block SPACE
+    python test_main_harness.py --speech-callback   # SPARK answers what the microphone hears
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
+
+from config import Config
+from persona import RobotPersona
+from robot_state import RobotState
+from conversation_graph import ConversationGraph
+from control import TerminalControl
+
+SPACE_LATENCY_LIMIT_MS = 50.0
+LOOP_LAG_LIMIT_MS = 20.0
+
+def _redraw_status(line):
+    """Redraw the status line in place; clear-to-EOL drops leftovers when the line gets shorter."""
+    sys.stdout.write(f"\r{line}\x1b[K" if sys.stdout.isatty() else f"\r{line}")
+    sys.stdout.flush()
+
+async def _check_responsiveness(terminal_control, state_changed):
+    """Warn (never fail) if the listening threads make the main thread or the SPACE key sluggish."""
+    loop = asyncio.get_running_loop()
+    
+    # GIL starvation: while the voice threads capture and recognize, time how late short sleeps wake up.
+    # Blocking reads and model inference release the GIL; a thread that held it would show up as lag here.
+    worst_lag_ms = 0.0
+    for _ in range(50):
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        worst_lag_ms = max(worst_lag_ms, (time.perf_counter() - start - 0.01) * 1000)
+    if worst_lag_ms < LOOP_LAG_LIMIT_MS:
+        print(f"✅ Main-thread wakeup lag while listening: {worst_lag_ms:.1f}ms")
+    else:
+        print(f"⚠️  Main thread woke up to {worst_lag_ms:.1f}ms late while listening (limit {LOOP_LAG_LIMIT_MS:.0f}ms)")
+    
+    # SPACE round-trip: pause, then unpause again, through the handler the key reader calls.
+    # Includes pause_listening/resume_listening - that is what a key press costs - but not thread start-up.
+    await loop.run_in_executor(None, int)  # Start the worker thread up front
+    worst_ms = 0.0
+    try:
+        for _ in range(2):
+            state_changed.clear()
+            start = time.perf_counter()
+            press = loop.run_in_executor(None, terminal_control.commands[' '])
+            await asyncio.wait_for(state_changed.wait(), 1.0)
+            worst_ms = max(worst_ms, (time.perf_counter() - start) * 1000)
+            await press
+    except TimeoutError:
+        print("⚠️  SPACE did not change the pause state within 1s while listening")
+        return
+    if worst_ms < SPACE_LATENCY_LIMIT_MS:
+        print(f"✅ SPACE round-trip while listening: {worst_ms:.1f}ms")
+    else:
+        print(f"⚠️  SPACE round-trip took {worst_ms:.1f}ms while listening (limit {SPACE_LATENCY_LIMIT_MS:.0f}ms)")
+
+async def run_harness(enable_voice=False, enable_speech_callback=False):
+    """Run SPARK with terminal control, optionally listening and optionally answering speech."""
+    enable_voice = enable_voice or enable_speech_callback
+    if enable_speech_callback:
+        print("🎤 Testing SPARK with Real Microphone Input")
+    elif enable_voice:
+        print("🤖 Testing SPARK Robot Assistant with Fixed Voice Handler")
+    else:
+        print("🤖 Testing SPARK Robot Assistant (Simplified)")
+    print("=" * 60)
+
+    try:
+        # Initialize components
+        print("📝 Initializing robot persona...")
+        persona = RobotPersona()
+
+        print("💾 Initializing state management...")
+        robot_state = RobotState()
+
+        print("🔄 Initializing conversation workflow...")
+        conversation_graph = ConversationGraph(robot_state, persona)
+
+        if enable_voice:
+            # Only the voice modes pay for PyAudio / the speech stack
+            from voice_handler import VoiceHandler
+            print("🎤 Initializing voice handler...")
+            voice_handler = VoiceHandler()
+
+        print("⌨️  Initializing terminal control...")
+        terminal_control = TerminalControl(robot_state)
+
+        loop = asyncio.get_running_loop()
+
+        if enable_voice:
+            # Set up connections
+            voice_handler.set_robot_state(robot_state)
+            robot_state.register_voice_handler(voice_handler)
+
+        if enable_speech_callback:
+            # Runs on the voice thread; conversations go to this loop
+            def on_speech_recognized(text: str):
+                """Callback for when speech is recognized."""
+                try:
+                    print(f"\n🎤 Speech recognized: '{text}'")
+
+                    # Run conversation workflow
+                    asyncio.run_coroutine_threadsafe(conversation_graph.run_conversation(text), loop).result()
+
+                except Exception as e:
+                    print(f"❌ Error processing speech: {e}")
+                    robot_state.mark_interaction_failure(f"Speech processing error: {e}")
+
+            voice_handler.set_callback(on_speech_recognized)
+
+        print("✅ Initialization complete! *beep* *whirr*")
+
+        # Start components
+        terminal_control.start()
+        if enable_voice:
+            voice_handler.start_listening()
+
+        print("\n🚀 SPARK Robot Assistant Ready!")
+        if enable_speech_callback:
+            print("🎯 Try saying: 'Hello SPARK' or 'What's your name?'")
+        print("Press SPACE to pause/unpause, 'h' for help, 'q' to quit")
+        if enable_voice:
+            print("Voice handler is running but should not block SPACE key!")
+        print("=" * 60)
+
+        # Redraw the status line when robot state changes (or once a second), not on a fixed tick
+        state_changed = asyncio.Event()
+        robot_state.add_state_listener(lambda: loop.call_soon_threadsafe(state_changed.set))
+
+        if enable_voice:
+            # Perf regression check: the listening threads must not starve the main thread or the key handler
+            await _check_responsiveness(terminal_control, state_changed)
+
+        count = 0
+        last_line = None
+        while True:
+            try:
+                # Show status
+                # Plain attribute reads; get_stats() builds a whole dict for two fields
+                status = "PAUSED" if robot_state.is_paused else "ACTIVE"
+                if enable_voice:
+                    voice_status = "VOICE ON" if voice_handler.is_listening else "VOICE OFF"
+                    line = f"[Status] {status} | {voice_status} | Battery: {robot_state.battery_level:.1f}%"
+                else:
+                    line = f"[Status] {status} | Battery: {robot_state.battery_level:.1f}%"
+                # Only touch the terminal when the displayed state actually changed
+                if line != last_line:
+                    count += 1
+                    _redraw_status(f"{line} | Count: {count}")
+                    last_line = line
+
+                state_changed.clear()
+                try:
+                    await asyncio.wait_for(state_changed.wait(), timeout=1.0)
+                except TimeoutError:
+                    pass
+
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                print("\n\n⚠️  Interrupt received, shutting down...")
+                break
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    finally:
+        if 'terminal_control' in locals():
+            terminal_control.stop()
+        if 'voice_handler' in locals():
+            voice_handler.stop_listening()
+        print("\n✅ Test completed!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Interactive SPARK main-application harness")
+    parser.add_argument("--voice", action="store_true", help="start the voice handler (listening only)")
+    parser.add_argument("--speech-callback", action="store_true",
+                        help="answer recognized speech through the conversation graph (implies --voice)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run_harness(args.voice, args.speech_callback))
+    except KeyboardInterrupt:
+        pass
@@ -3,75 +3,90 @@
 Test script to check microphone access and audio devices.
 """
 
-import sys
 import os
-sys.path.insert(0, 'src')
+import time
+import atexit
+
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
+
+_pa = None
+_mic_names = None
+
+def _get_pa():
+    """Shared PyAudio instance; initializing PortAudio probes every host API, so do it once."""
+    global _pa
+    if _pa is None:
+        import pyaudio
+        _pa = pyaudio.PyAudio()
+        atexit.register(_pa.terminate)
+    return _pa
+
+def _get_mic_names():
+    global _mic_names
+    if _mic_names is None:
+        import speech_recognition as sr
+        _mic_names = tuple(sr.Microphone.list_microphone_names())
+    return _mic_names
 
 def test_audio_devices():
     """Test available audio devices."""
     print("🎤 Testing Audio Devices")
     print("=" * 40)
     
+    # Enumerate PortAudio devices once; tests 1-3 all report from this list
+    input_devices, output_devices, device_error = [], [], None
+    try:
+        p = _get_pa()
+        for i in range(p.get_device_count()):
+            try:
+                info = p.get_device_info_by_index(i)
+                if info['maxInputChannels'] > 0:
+                    input_devices.append((i, info['name']))
+                if info['maxOutputChannels'] > 0:
+                    output_devices.append((i, info['name']))
+            except Exception:
+                pass
+    except Exception as e:
+        device_error = e
+    
     # Test 1: Check system audio devices
     print("\n1️⃣  System Audio Devices:")
     print("-" * 20)
     
-    try:
-        import subprocess
-        result = subprocess.run(['arecord', '-l'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Recording devices found:")
-            print(result.stdout)
-        else:
-            print("❌ No recording devices found")
-            print("Error:", result.stderr)
-    except FileNotFoundError:
-        print("❌ 'arecord' command not found. Install alsa-utils:")
-        print("   sudo apt install alsa-utils")
+    if input_devices:
+        print("✅ Recording devices found:")
+        for i, name in input_devices:
+            print(f"   {i}: {name}")
+    else:
+        print("❌ No recording devices found")
     
     # Test 2: Check playback devices
     print("\n2️⃣  Playback Devices:")
     print("-" * 20)
     
-    try:
-        result = subprocess.run(['aplay', '-l'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Playback devices found:")
-            print(result.stdout)
-        else:
-            print("❌ No playback devices found")
-            print("Error:", result.stderr)
-    except FileNotFoundError:
-        print("❌ 'aplay' command not found")
+    if output_devices:
+        print("✅ Playback devices found:")
+        for i, name in output_devices:
+            print(f"   {i}: {name}")
+    else:
+        print("❌ No playback devices found")
     
     # Test 3: Check Python audio libraries
     print("\n3️⃣  Python Audio Libraries:")
     print("-" * 20)
     
-    try:
-        import pyaudio
-        print("✅ PyAudio available")
-        
-        # List available devices
-        p = pyaudio.PyAudio()
-        print(f"📊 Total devices: {p.get_device_count()}")
-        
-        for i in range(p.get_device_count()):
-            try:
-                info = p.get_device_info_by_index(i)
-                if info['maxInputChannels'] > 0:
-                    print(f"🎤 Input Device {i}: {info['name']}")
-                if info['maxOutputChannels'] > 0:
-                    print(f"🔊 Output Device {i}: {info['name']}")
-            except:
-                pass
-        p.terminate()
-        
-    except ImportError:
+    if isinstance(device_error, ImportError):
         print("❌ PyAudio not available")
         print("   Install: pip install pyaudio")
-    except Exception as e:
-        print(f"❌ PyAudio error: {e}")
+    elif device_error is not None:
+        print(f"❌ PyAudio error: {device_error}")
+    else:
+        print("✅ PyAudio available")
+        print(f"📊 Total devices: {_get_pa().get_device_count()}")
+        for i, name in input_devices:
+            print(f"🎤 Input Device {i}: {name}")
+        for i, name in output_devices:
+            print(f"🔊 Output Device {i}: {name}")
     
     # Test 4: Check speech recognition
     print("\n4️⃣  Speech Recognition:")
@@ -83,7 +98,7 @@ def test_audio_devices():
         
         # List available microphones
         print("📱 Available microphones:")
-        for i, mic in enumerate(sr.Microphone.list_microphone_names()):
+        for i, mic in enumerate(_get_mic_names()):
             print(f"   {i}: {mic}")
             
     except ImportError:
@@ -97,18 +112,17 @@ def test_audio_devices():
     print("-" * 20)
     
     try:
-        result = subprocess.run(['groups'], capture_output=True, text=True)
-        if result.returncode == 0:
-            groups = result.stdout.strip().split()
-            if 'audio' in groups:
-                print("✅ User is in 'audio' group")
-            else:
-                print("❌ User NOT in 'audio' group")
-                print("   Add user to audio group:")
-                print("   sudo usermod -a -G audio $USER")
-                print("   (Then log out and back in)")
+        import grp
+        groups = [grp.getgrgid(g).gr_name for g in os.getgroups()]
+        if 'audio' in groups:
+            print("✅ User is in 'audio' group")
         else:
-            print("❌ Could not check user groups")
+            print("❌ User NOT in 'audio' group")
+            print("   Add user to audio group:")
+            print("   sudo usermod -a -G audio $USER")
+            print("   (Then log out and back in)")
+    except ImportError:
+        print("❌ Could not check user groups (no grp module on this platform)")
     except Exception as e:
         print(f"❌ Permission check error: {e}")
     
@@ -130,33 +144,47 @@ def test_audio_devices():
         RATE = 44100
         RECORD_SECONDS = 3
         
-        p = pyaudio.PyAudio()
-        
-        stream = p.open(format=FORMAT,
-                       channels=CHANNELS,
-                       rate=RATE,
-                       input=True,
-                       frames_per_buffer=CHUNK)
-        
-        print("   Recording...")
-        frames = []
-        
-        for i in range(0, int(RATE / CHUNK * RECORD_SECONDS)):
-            data = stream.read(CHUNK)
-            frames.append(data)
+        p = _get_pa()
         
-        print("   Recording complete!")
+        # Write each block to the WAV from the PortAudio callback; only one block is ever held
+        target = RATE * RECORD_SECONDS * CHANNELS * p.get_sample_size(FORMAT)
+        written = 0
         
-        stream.stop_stream()
-        stream.close()
-        p.terminate()
-        
-        # Save the recorded audio
         with wave.open("test_recording.wav", 'wb') as wf:
             wf.setnchannels(CHANNELS)
             wf.setsampwidth(p.get_sample_size(FORMAT))
             wf.setframerate(RATE)
-            wf.writeframes(b''.join(frames))
+            
+            def on_audio(in_data, frame_count, time_info, status):
+                nonlocal written
+                chunk = in_data[:target - written]
+                wf.writeframes(chunk)
+                written += len(chunk)
+                return (None, pyaudio.paContinue if written < target else pyaudio.paComplete)
+            
+            stream = p.open(format=FORMAT,
+                           channels=CHANNELS,
+                           rate=RATE,
+                           input=True,
+                           frames_per_buffer=CHUNK,
+                           stream_callback=on_audio)
+            
+            try:
+                print("   Recording...")
+                stream.start_stream()
+                time.sleep(RECORD_SECONDS)
+                # Bounded: a stalled device (callback no longer called) must not hang the test
+                deadline = time.monotonic() + 2.0
+                while stream.is_active() and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                if written < target:
+                    raise TimeoutError(f"microphone stalled after {written} of {target} bytes")
+                
+                print("   Recording complete!")
+            finally:
+                # Stop the callback before the with block closes the WAV it writes to
+                stream.stop_stream()
+                stream.close()
         
         print("✅ Recording saved as 'test_recording.wav'")
         print("   File size:", os.path.getsize("test_recording.wav"), "bytes")
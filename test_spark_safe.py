@@ -5,16 +5,35 @@ Safe test script for SPARK Robot Assistant with timeout protection.
 
 import sys
 import time
-import threading
+import asyncio
 import signal
-sys.path.insert(0, 'src')
+import threading
+import concurrent.futures
+
+from conftest import get_persona
 
 from config import Config
-from persona import RobotPersona
 from robot_state import RobotState
 from conversation_graph import ConversationGraph
-from voice_handler import VoiceHandler
 from control import TerminalControl
+from voice_handler import VoiceHandler
+
+try:
+    import uvloop  # Optional: libuv-based event loop, faster scheduling for the LLM round-trips
+except ImportError:
+    uvloop = None
+
+# Status line, formatted straight to bytes for the binary stdout buffer (no str build + encode).
+# Fixed width, so a redraw always covers the previous one without padding or clearing.
+STATUS_LINE = b"\r[Status] %-6s | %-9s | Battery: %5.1f%% | Count: %10d"
+
+async def _cancel_all_tasks():
+    """Cancel every other task on the running loop and wait until they have unwound."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 class SafeSPARKTest:
     """Safe test class with timeout protection."""
@@ -23,53 +42,117 @@ class SafeSPARKTest:
         self.running = False
         self.voice_handler = None
         self.terminal_control = None
+        self._loop = None  # Main-thread event loop: signals and the status line
+        self._conv_loop = None  # Dedicated loop thread for conversations, so they can't stall the main loop
+        self._conv_thread = None
+        self._quit_event = asyncio.Event()  # Signal received; ends the main loop
+        self._state_changed = asyncio.Event()  # Wakes the main loop to redraw the status
         
-    def signal_handler(self, signum, frame):
-        """Handle interrupt signals."""
-        print(f"\n⚠️  Signal {signum} received, shutting down safely...")
-        self.shutdown()
-        sys.exit(0)
+    def _on_signal(self):
+        """SIGINT/SIGTERM, dispatched by the event loop; cleanup happens in run_safe_test's finally."""
+        self._quit_event.set()
+        self._state_changed.set()
     
-    def shutdown(self):
+    def _on_state_change(self):
+        """RobotState listener; runs on whichever thread changed the state."""
+        self._loop.call_soon_threadsafe(self._state_changed.set)
+    
+    async def shutdown(self):
         """Safely shutdown all components."""
         print("[Safe] Shutting down SPARK safely...")
         self.running = False
         
-        if self.terminal_control:
-            self.terminal_control.stop()
-            print("[Safe] Terminal control stopped")
+        # Refuse new conversations, then cancel the running ones: the voice thread waits on them,
+        # so stopping the voice handler first would always end in "left behind"
+        conv_loop, self._conv_loop = self._conv_loop, None
+        if conv_loop:
+            try:
+                await asyncio.wait_for(
+                    asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_cancel_all_tasks(), conv_loop)), 2.0)
+            except TimeoutError:
+                print("[Safe] Conversations still running after 2s")
         
+        stops = {}
+        if self.terminal_control:
+            stops["Terminal control"] = self.terminal_control.stop
         if self.voice_handler:
-            self.voice_handler.stop_listening()
-            print("[Safe] Voice handler stopped")
+            stops["Voice handler"] = self.voice_handler.stop_listening
+        
+        if stops:
+            # Each stop joins a worker thread; run them side by side on daemon threads so shutdown takes
+            # the longest, not the sum, and a stop that hangs past the deadline is left behind for real
+            # (an executor thread would keep asyncio.run from returning until it finished).
+            errors = {}
+            
+            def run_stop(name, stop):
+                try:
+                    stop()
+                except Exception as e:
+                    errors[name] = e
+            
+            threads = {name: threading.Thread(target=run_stop, args=(name, stop), daemon=True)
+                       for name, stop in stops.items()}
+            for thread in threads.values():
+                thread.start()
+            
+            def join_all(deadline):
+                for thread in threads.values():
+                    thread.join(max(0.0, deadline - time.monotonic()))
+            
+            # Bounded wait off the main loop, so it keeps serving signals meanwhile
+            await asyncio.to_thread(join_all, time.monotonic() + 3.0)
+            for name, thread in threads.items():
+                if thread.is_alive():
+                    print(f"[Safe] {name} still stopping after 3s, leaving it behind")
+                elif name in errors:
+                    print(f"[Safe] {name} failed to stop: {errors[name]}")
+                else:
+                    print(f"[Safe] {name} stopped")
+        
+        if conv_loop:
+            conv_loop.call_soon_threadsafe(conv_loop.stop)
+            self._conv_thread.join(timeout=2.0)
+            if not self._conv_thread.is_alive():
+                conv_loop.close()
         
         print("[Safe] Shutdown complete")
     
+    async def _handle_speech(self, text: str):
+        """Run one conversation, cancelling it if it takes longer than 30 seconds."""
+        try:
+            async with asyncio.timeout(30):
+                await self.conversation_graph.run_conversation(text)
+            print("[Safe] Conversation completed successfully")
+        except TimeoutError:
+            print("[Safe] Conversation timed out - stopping")
+    
     def test_speech_callback(self, text: str):
         """Test callback for speech recognition with timeout protection."""
         try:
             print(f"\n🎤 Speech recognized: '{text}'")
             
-            # Set a timeout for the entire conversation
-            import asyncio
-            import concurrent.futures
+            conv_loop = self._conv_loop
+            if conv_loop is None:
+                print("[Safe] Shutting down - ignoring speech")
+                return
+            
+            # Hand off to the conversation loop; the timeout cancels the conversation task itself.
+            # The wait is bounded too, a little past that timeout, in case the loop itself is stuck.
+            future = asyncio.run_coroutine_threadsafe(self._handle_speech(text), conv_loop)
+            try:
+                future.result(timeout=35)
+            except TimeoutError:
+                future.cancel()
+                print("[Safe] Conversation loop unresponsive - giving up on this turn")
+            except concurrent.futures.CancelledError:
+                print("[Safe] Conversation cancelled by shutdown")
             
-            # Run conversation with timeout
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, self.conversation_graph.run_conversation(text))
-                try:
-                    future.result(timeout=30)  # 30 second timeout
-                    print("[Safe] Conversation completed successfully")
-                except concurrent.futures.TimeoutError:
-                    print("[Safe] Conversation timed out - stopping")
-                    future.cancel()
-                    
         except Exception as e:
             print(f"❌ Error processing speech: {e}")
             if self.robot_state:
                 self.robot_state.mark_interaction_failure(f"Speech processing error: {e}")
     
-    def run_safe_test(self):
+    async def run_safe_test(self):
         """Run the safe test with all protections."""
         print("🤖 Safe SPARK Robot Assistant Test")
         print("=" * 50)
@@ -78,13 +161,14 @@ class SafeSPARKTest:
         print()
         
         try:
-            # Set up signal handlers
-            signal.signal(signal.SIGINT, self.signal_handler)
-            signal.signal(signal.SIGTERM, self.signal_handler)
+            # Set up signal handlers; the loop runs them between callbacks, not in signal context
+            self._loop = asyncio.get_running_loop()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                self._loop.add_signal_handler(signum, self._on_signal)
             
             # Initialize components
             print("📝 Initializing SPARK safely...")
-            self.persona = RobotPersona()
+            self.persona = get_persona()
             self.robot_state = RobotState()
             self.conversation_graph = ConversationGraph(self.robot_state, self.persona)
             self.voice_handler = VoiceHandler()
@@ -94,6 +178,11 @@ class SafeSPARKTest:
             self.voice_handler.set_robot_state(self.robot_state)
             self.robot_state.register_voice_handler(self.voice_handler)
             
+            # One long-lived loop for every conversation, off the main loop that serves signals and status
+            self._conv_loop = asyncio.new_event_loop()
+            self._conv_thread = threading.Thread(target=self._conv_loop.run_forever, daemon=True)
+            self._conv_thread.start()
+            
             # Set up speech callback
             self.voice_handler.set_callback(self.test_speech_callback)
             
@@ -111,49 +200,64 @@ class SafeSPARKTest:
             print("⚠️  Press Ctrl+C to stop safely")
             print("=" * 60)
             
-            # Main loop with safety checks
+            # Main loop with safety checks; sleeps until state changes (or 1s passes) instead of polling
+            self.robot_state.add_state_listener(self._on_state_change)
             self.running = True
             count = 0
-            last_speech_check = time.time()
+            prev_key = None
+            out = sys.stdout.buffer
+            last_speech_check = time.monotonic()
             
-            while self.running:
+            while not (self._quit_event.is_set() or self.robot_state.should_quit):
                 try:
-                    # Show status
-                    stats = self.robot_state.get_stats()
-                    status = "PAUSED" if stats['is_paused'] else "ACTIVE"
-                    voice_status = "VOICE ON" if self.voice_handler.is_listening else "VOICE OFF"
-                    print(f"\r[Status] {status} | {voice_status} | Battery: {stats['battery_level']:.1f}% | Count: {count}", end="")
+                    self._state_changed.clear()
                     
-                    count += 1
-                    time.sleep(0.1)
+                    # Show status, only when it changed; the line is only formatted then
+                    stats = self.robot_state.get_stats()
+                    key = (stats.is_paused, round(stats.battery_level, 1), self.voice_handler.is_listening)
+                    if key != prev_key:
+                        is_paused, battery_level, is_listening = key
+                        count += 1
+                        sys.stdout.flush()  # Anything printed through the text layer goes out first
+                        out.write(STATUS_LINE % (b"PAUSED" if is_paused else b"ACTIVE",
+                                                 b"VOICE ON" if is_listening else b"VOICE OFF",
+                                                 battery_level, count))
+                        out.flush()
+                        prev_key = key
                     
                     # Safety check: if no speech for 60 seconds, show reminder
-                    if time.time() - last_speech_check > 60:
+                    if time.monotonic() - last_speech_check > 60:
                         print(f"\n[Safe] No speech detected for 60s. Try saying something or press Ctrl+C to stop.")
-                        last_speech_check = time.time()
+                        last_speech_check = time.monotonic()
                     
-                    # Check if global quit command was received
-                    if self.robot_state.should_quit:
-                        print("\n[Global Control] Quit command received, shutting down...")
-                        break
+                    try:
+                        await asyncio.wait_for(self._state_changed.wait(), timeout=1.0)
+                    except TimeoutError:
+                        pass
                         
-                except KeyboardInterrupt:
-                    print("\n\n⚠️  Interrupt received, shutting down safely...")
-                    break
                 except Exception as e:
                     print(f"\n❌ Error in main loop: {e}")
                     break
+            
+            # Check if global quit command was received
+            if self.robot_state.should_quit:
+                print("\n[Global Control] Quit command received, shutting down...")
+            elif self._quit_event.is_set():
+                print("\n\n⚠️  Interrupt received, shutting down safely...")
                     
         except Exception as e:
             print(f"❌ Critical error: {e}")
         finally:
-            self.shutdown()
+            await self.shutdown()
             print("\n✅ Safe test completed!")
 
 def main():
     """Main function."""
     test = SafeSPARKTest()
-    test.run_safe_test()
+    try:
+        asyncio.run(test.run_safe_test(), loop_factory=uvloop.new_event_loop if uvloop else None)
+    except KeyboardInterrupt:
+        pass
 
 if __name__ == "__main__":
     main()
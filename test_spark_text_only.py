@@ -4,15 +4,23 @@ Text-only test script for SPARK Robot Assistant.
 Tests AI responses without voice complications.
 """
 
-import sys
 import asyncio
-sys.path.insert(0, 'src')
+
+import httpx
+
+from conftest import get_persona
 
 from config import Config
-from persona import RobotPersona
 from robot_state import RobotState
 from conversation_graph import ConversationGraph
 
+try:
+    import uvloop  # Optional: libuv-based event loop, faster scheduling for the LLM round-trips
+except ImportError:
+    uvloop = None
+
+QUESTION_TIMEOUT_S = 30  # Per question; None disables it (e.g. when stepping through in a debugger)
+
 async def test_text_conversation():
     """Test text conversation with SPARK."""
     print("🤖 SPARK Text-Only Conversation Test")
@@ -20,12 +28,16 @@ async def test_text_conversation():
     print("This test verifies AI responses without voice complications.")
     print()
     
+    # One pooled client for every question: one TLS handshake instead of one per request
+    http_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_keepalive_connections=5))
+    
     try:
         # Initialize components
         print("📝 Initializing SPARK...")
-        persona = RobotPersona()
+        persona = get_persona()
         robot_state = RobotState()
-        conversation_graph = ConversationGraph(robot_state, persona)
+        # Own graph: it is bound to this test's pooled HTTP client
+        conversation_graph = ConversationGraph(robot_state, persona, http_client=http_client)
         
         print("✅ SPARK initialized successfully!")
         print()
@@ -39,28 +51,52 @@ async def test_text_conversation():
             "Explain quantum computing in simple terms"
         ]
         
-        for i, question in enumerate(test_questions, 1):
+        async def _ask(question):
+            # A hung LLM call is cancelled instead of stalling the whole test; failures come back
+            # as the result so one bad question doesn't make the TaskGroup cancel the others
+            try:
+                async with asyncio.timeout(QUESTION_TIMEOUT_S):
+                    await conversation_graph.run_conversation(question)
+            except Exception as e:
+                return e
+            return None
+        
+        # Ask everything at once: total time tracks the slowest answer, not the sum of all of them
+        print(f"🎯 Asking {len(test_questions)} questions concurrently...")
+        print()
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_ask(question)) for question in test_questions]
+        
+        for i, (question, task) in enumerate(zip(test_questions, tasks), 1):
+            result = task.result()
             print(f"🎯 Test {i}: {question}")
             print("-" * 40)
-            
-            try:
-                await conversation_graph.run_conversation(question)
+            if isinstance(result, TimeoutError):
+                print(f"❌ Timed out after {QUESTION_TIMEOUT_S}s")
+            elif isinstance(result, Exception):
+                print(f"❌ Error: {result}")
+            else:
                 print("✅ Response generated successfully")
-            except Exception as e:
-                print(f"❌ Error: {e}")
-            
             print()
-            await asyncio.sleep(1)  # Brief pause between questions
         
         print("🎉 All text conversation tests completed!")
         
+    except asyncio.CancelledError:
+        # Ctrl+C: asyncio.run cancels this task, the TaskGroup cancels the questions still in flight
+        print("\n⚠️  Interrupted, skipping the remaining questions")
+        raise
     except Exception as e:
         print(f"❌ Critical error: {e}")
+    finally:
+        await http_client.aclose()
 
 def main():
     """Main function."""
     print("🚀 Starting SPARK Text-Only Test...")
-    asyncio.run(test_text_conversation())
+    try:
+        asyncio.run(test_text_conversation(), loop_factory=uvloop.new_event_loop if uvloop else None)
+    except KeyboardInterrupt:
+        pass
 
 if __name__ == "__main__":
     main()
@@ -3,14 +3,14 @@
 Test script to check if terminal control is working properly.
 """
 
-import sys
-import time
-import threading
-import sys
-sys.path.insert(0, 'src')
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
+
 from control import TerminalControl
 from robot_state import RobotState
 
+# Fixed width, so a redraw always covers the previous one without padding or clearing
+STATUS_TEMPLATE = "\rStatus: {:<6} | Battery: {:5.1f}% | Count: {:>10}"
+
 def test_terminal_control():
     """Test terminal control functionality."""
     print("Testing terminal control...")
@@ -29,14 +29,19 @@ def test_terminal_control():
     try:
         # Keep the main thread alive
         count = 0
-        while True:
+        prev_key = None
+        version = robot_state.state_version
+        while not robot_state.should_quit:
             # Show current status
             stats = robot_state.get_stats()
-            status = "PAUSED" if stats['is_paused'] else "ACTIVE"
-            print(f"\rStatus: {status} | Battery: {stats['battery_level']:.1f}% | Count: {count}", end="")
+            key = (stats.is_paused, round(stats.battery_level, 1))
+            if key != prev_key:
+                count += 1
+                print(STATUS_TEMPLATE.format("PAUSED" if key[0] else "ACTIVE", key[1], count), end="")
+                prev_key = key
             
-            count += 1
-            time.sleep(1)
+            # Sleep until the state changes (or a second passes) instead of on a fixed tick
+            version = robot_state.wait_for_state_change(version, timeout=1.0)
             
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
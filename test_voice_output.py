@@ -3,12 +3,12 @@
 Test SPARK's voice output functionality
 """
 
-import sys
 import os
-sys.path.insert(0, 'src')
 
-from voice_handler import VoiceHandler
+import conftest  # noqa: F401  (line-buffered stdout, src/ on sys.path)
+
 from config import Config
+from voice_handler import VoiceHandler
 
 def test_voice_output():
     """Test SPARK's voice output."""